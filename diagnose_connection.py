@@ -4,7 +4,7 @@
 """
 import sys
 import os
-import json
+import re
 import socket
 import urllib.parse
 import urllib.request
@@ -12,6 +12,20 @@ import ssl
 import xmlrpc.client
 from urllib.error import URLError, HTTPError
 
+# 优先使用更快的 orjson（可选依赖）
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+# 确保可以导入我们的模块
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from odoo_mcp.odoo_client import resolve
+
+# 响应内容中的 Odoo 标识
+_ODOO_MARK = re.compile(rb'odoo|openerp', re.IGNORECASE)
+
 def test_basic_connectivity():
     """测试基本网络连接"""
     print("=== 基本网络连接测试 ===")
@@ -22,18 +36,18 @@ def test_basic_connectivity():
         return False
         
     with open(config_file, 'r') as f:
-        config = json.load(f)
+        config = json.loads(f.read())
     
     url = config['url']
     parsed = urllib.parse.urlparse(url)
-    hostname = parsed.netloc
+    hostname = parsed.hostname
     port = parsed.port or (443 if parsed.scheme == 'https' else 80)
     
     print(f"目标服务器: {hostname}:{port}")
     
     # 1. DNS 解析测试
     try:
-        ip = socket.gethostbyname(hostname)
+        ip = resolve(hostname)
         print(f"✓ DNS 解析成功: {hostname} -> {ip}")
     except socket.gaierror as e:
         print(f"✗ DNS 解析失败: {e}")
@@ -41,9 +55,10 @@ def test_basic_connectivity():
     
     # 2. TCP 连接测试
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        family = socket.AF_INET6 if ':' in ip else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
         sock.settimeout(10)
-        result = sock.connect_ex((hostname, port))
+        result = sock.connect_ex((ip, port))
         sock.close()
         if result == 0:
             print(f"✓ TCP 连接成功: {hostname}:{port}")
@@ -77,8 +92,8 @@ def test_basic_connectivity():
             print(f"  内容类型: {headers.get('Content-Type', 'Unknown')}")
             
             # 检查是否是 Odoo 服务器
-            content = response.read(1024).decode('utf-8', errors='ignore')
-            if 'odoo' in content.lower() or 'openerp' in content.lower():
+            buf = response.read(1024)
+            if _ODOO_MARK.search(buf):
                 print("✓ 检测到 Odoo 服务器")
             else:
                 print("⚠ 未检测到明显的 Odoo 标识")
@@ -100,7 +115,7 @@ def test_xmlrpc_endpoints():
     print("\n=== XML-RPC 端点测试 ===")
     
     with open("odoo_config.json", 'r') as f:
-        config = json.load(f)
+        config = json.loads(f.read())
     
     url = config['url']
     
@@ -132,7 +147,7 @@ def test_authentication():
     print("\n=== 认证测试 ===")
     
     with open("odoo_config.json", 'r') as f:
-        config = json.load(f)
+        config = json.loads(f.read())
     
     try:
         common_url = f"{config['url']}/xmlrpc/2/common"
@@ -179,7 +194,7 @@ def check_proxy_settings():
     
     # 检查配置文件中是否有代理设置
     with open("odoo_config.json", 'r') as f:
-        config = json.load(f)
+        config = json.loads(f.read())
     
     if 'proxy' in config:
         print(f"配置文件中的代理设置: {config['proxy']}")
@@ -5,20 +5,29 @@ Uses the same approach as in the official MCP SDK examples
 """
 import sys
 import os
+import atexit
 import asyncio
 import anyio
 import logging
+import logging.handlers
+import queue
 import datetime
 
 from mcp.server.stdio import stdio_server
 from mcp.server.lowlevel import Server
 import mcp.types as types
 
+from odoo_mcp.odoo_client import LOGGED_ENV_VARS, configure_logging
 from odoo_mcp.server import mcp  # FastMCP instance from our code
 
 
 def setup_logging():
-    """Set up logging to both console and file"""
+    """
+    Set up logging to both console and file
+
+    Records are handed to a queue and written by a background listener
+    thread, so logging never blocks the server on console or disk I/O.
+    """
     log_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
     os.makedirs(log_dir, exist_ok=True)
     
@@ -33,8 +42,10 @@ def setup_logging():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     
-    # File handler
-    file_handler = logging.FileHandler(log_file)
+    # File handler (rotated so a long-running server does not grow one huge file)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=10_000_000, backupCount=3
+    )
     file_handler.setLevel(logging.DEBUG)
     
     # Format for both handlers
@@ -42,9 +53,17 @@ def setup_logging():
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
     
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Log through a queue; the listener thread does the actual writes
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # ODOO_LOG_LEVEL=DEBUG traces every Odoo request, to the file only
+    configure_logging()
     
     return logger
 
@@ -58,13 +77,12 @@ def main() -> int:
     try:
         logger.info("=== ODOO MCP SERVER STARTING XYT ===")
         logger.info(f"Python version: {sys.version}")
-        logger.info("Environment variables:")
-        for key, value in os.environ.items():
-            if key.startswith("ODOO_"):
-                if key == "ODOO_PASSWORD":
-                    logger.info(f"  {key}: ***hidden***")
-                else:
-                    logger.info(f"  {key}: {value}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Environment variables:")
+            for key in LOGGED_ENV_VARS:
+                value = os.environ.get(key)
+                if value:
+                    logger.info("  %s: %s", key, value)
         
         logger.info(f"MCP object type: {type(mcp)}")
         
@@ -6,6 +6,7 @@ import asyncio
 import traceback
 import os
 
+from .odoo_client import LOGGED_ENV_VARS, configure_logging
 from .server import mcp
 
 
@@ -14,15 +15,15 @@ def main() -> int:
     Run the MCP server
     """
     try:
+        configure_logging()
+
         print("=== ODOO MCP SERVER STARTING XYT ===", file=sys.stderr)
         print(f"Python version: {sys.version}", file=sys.stderr)
         print("Environment variables:", file=sys.stderr)
-        for key, value in os.environ.items():
-            if key.startswith("ODOO_"):
-                if key == "ODOO_PASSWORD":
-                    print(f"  {key}: ***hidden***", file=sys.stderr)
-                else:
-                    print(f"  {key}: {value}", file=sys.stderr)
+        for key in LOGGED_ENV_VARS:
+            value = os.environ.get(key)
+            if value:
+                print(f"  {key}: {value}", file=sys.stderr)
         
         # Check if server instance has the run_stdio method
         methods = [method for method in dir(mcp) if not method.startswith('_')]
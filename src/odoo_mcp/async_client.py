@@ -0,0 +1,337 @@
+"""
+Asynchronous Odoo XML-RPC client for MCP server integration
+"""
+
+import asyncio
+import importlib.util
+import itertools
+import logging
+import xmlrpc.client
+
+import httpx
+
+from .cache import ModelMetadataCache
+from .odoo_client import (
+    _READ_METHODS,
+    _RETRY_HTTP_CODES,
+    _backoff_delay,
+    _is_access_denied,
+)
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 is only negotiated when the optional h2 package is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Redirects followed before a request fails, as in RedirectTransport
+MAX_REDIRECTS = 5
+
+
+class AsyncOdooClient:
+    """
+    Client for calling Odoo via XML-RPC from asyncio code
+
+    Requests go through a pooled httpx.AsyncClient, so MCP tool handlers can
+    await Odoo without blocking the event loop and several calls can be in
+    flight at the same time. Like OdooClient, it retries reads on transient
+    network errors and logs in again when a reused login is rejected.
+    """
+
+    def __init__(
+        self,
+        url,
+        db,
+        username,
+        password,
+        uid=None,
+        timeout=10,
+        verify_ssl=True,
+        protocol="xmlrpc",
+        max_concurrency=32,
+        on_write=None,
+        metadata_cache=None,
+    ):
+        """
+        Initialize the async Odoo client with connection parameters
+
+        Args:
+            url: Odoo server URL (including protocol)
+            db: Database name
+            username: Login username
+            password: Login password
+            uid: User ID of an existing login, if any
+            timeout: Request timeout in seconds
+            verify_ssl: Whether to verify SSL certificates
+            protocol: "xmlrpc", or "jsonrpc" to use Odoo's /jsonrpc endpoint
+            max_concurrency: Maximum number of requests in flight; further
+                calls wait for a free slot instead of piling onto Odoo
+            on_write: Called with the model name after each call of a method
+                that may change data, e.g. to invalidate caches
+            metadata_cache: ModelMetadataCache for data that rarely changes
+                (default: a new one)
+        """
+        if protocol not in ("xmlrpc", "jsonrpc"):
+            raise ValueError(f"Unsupported protocol: {protocol}")
+
+        self.url = url
+        self.db = db
+        self.username = username
+        self.password = password
+        self.uid = uid
+        self.protocol = protocol
+        self.on_write = on_write
+        self.metadata_cache = metadata_cache or ModelMetadataCache()
+
+        self._ids = itertools.count(1)
+        self._auth_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._http = httpx.AsyncClient(
+            base_url=url,
+            limits=httpx.Limits(
+                max_connections=max_concurrency, max_keepalive_connections=20
+            ),
+            http2=_HTTP2,
+            timeout=timeout,
+            verify=verify_ssl,
+            # Redirects are followed by _post(), which keeps the POST
+            follow_redirects=False,
+        )
+
+    @classmethod
+    def from_client(cls, client):
+        """
+        Create an async client sharing the settings and login of an OdooClient
+
+        Args:
+            client: A connected OdooClient
+
+        Returns:
+            AsyncOdooClient: Client reusing the same server, database and user
+        """
+        return cls(
+            url=client.url,
+            db=client.db,
+            username=client.username,
+            password=client.password,
+            # Reuse an existing login without forcing one
+            uid=client.logged_in_uid,
+            timeout=client.timeout,
+            verify_ssl=client.verify_ssl,
+            protocol=client.protocol,
+            # Writes sent here must not leave stale reads in the sync client
+            on_write=client.invalidate_for_write,
+            metadata_cache=client.metadata_cache,
+        )
+
+    async def _call(self, service, method, params, max_retries=1):
+        """
+        Call ``method`` of the "common" or "object" service
+
+        Transient network errors are retried with exponential backoff, up to
+        ``max_retries`` attempts in total, the same way as _with_retry() in
+        odoo_client does for the sync client.
+        """
+        for attempt in range(max_retries):
+            try:
+                async with self._slots:
+                    return await self._send(service, method, params)
+            except xmlrpc.client.Fault:
+                raise
+            except xmlrpc.client.ProtocolError as e:
+                if e.errcode not in _RETRY_HTTP_CODES or attempt == max_retries - 1:
+                    raise
+                error = e
+            except httpx.TransportError as e:
+                if attempt == max_retries - 1:
+                    raise
+                error = e
+
+            delay = _backoff_delay(attempt)
+            logger.warning("Request failed (%s), retrying in %.1fs", error, delay)
+            await asyncio.sleep(delay)
+
+    async def _send(self, service, method, params):
+        """Send one request over the configured protocol"""
+        if self.protocol == "jsonrpc":
+            return await self._call_jsonrpc(service, method, params)
+
+        endpoint = f"/xmlrpc/2/{service}"
+        body = xmlrpc.client.dumps(params, methodname=method)
+        logger.debug("Making request to %s%s", self.url, endpoint)
+        response = await self._post(endpoint, body, {"Content-Type": "text/xml"})
+
+        # loads() raises xmlrpc.client.Fault for fault responses
+        (result,), _ = xmlrpc.client.loads(response.content)
+        return result
+
+    async def _call_jsonrpc(self, service, method, params):
+        """Send one JSON-RPC call and return its result"""
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": list(params)},
+            "id": next(self._ids),
+        }
+        logger.debug("Making request to %s/jsonrpc (%s.%s)", self.url, service, method)
+        response = await self._post(
+            "/jsonrpc", _json.dumps(payload), {"Content-Type": "application/json"}
+        )
+
+        reply = _json.loads(response.content)
+        error = reply.get("error")
+        if error:
+            # Raised like XML-RPC faults, see JsonRpcTransport in odoo_client
+            data = error.get("data") or {}
+            raise xmlrpc.client.Fault(
+                error.get("code", 1), data.get("message") or error.get("message")
+            )
+        return reply.get("result")
+
+    async def _post(self, url, content, headers):
+        """
+        POST ``content`` to ``url``, sending it again to the new location if
+        the server redirects
+
+        httpx would turn a redirected POST into a GET, which Odoo's RPC
+        endpoints reject. RedirectTransport in odoo_client follows redirects
+        the same way.
+
+        Raises:
+            xmlrpc.client.ProtocolError: If the final response is not a 200
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._http.post(url, content=content, headers=headers)
+            if not response.is_redirect:
+                break
+            url = response.url.join(response.headers["location"])
+        else:
+            raise xmlrpc.client.ProtocolError(str(url), 310, "Too many redirects", {})
+
+        if response.status_code != 200:
+            raise xmlrpc.client.ProtocolError(
+                str(response.url),
+                response.status_code,
+                response.reason_phrase,
+                dict(response.headers),
+            )
+        return response
+
+    async def authenticate(self):
+        """
+        Log in and store the user ID
+
+        Returns:
+            int: The authenticated user ID
+        """
+        async with self._auth_lock:
+            if self.uid is None:
+                uid = await self._call(
+                    "common",
+                    "authenticate",
+                    (self.db, self.username, self.password, {}),
+                    max_retries=3,
+                )
+                if not uid:
+                    raise ValueError(
+                        "Authentication failed: Invalid username or password"
+                    )
+                self.uid = uid
+        return self.uid
+
+    async def execute_method(self, model, method, *args, **kwargs):
+        """
+        Execute an arbitrary method on a model
+
+        Args:
+            model: The model name (e.g., 'res.partner')
+            method: Method name to execute
+            *args: Positional arguments to pass to the method
+            **kwargs: Keyword arguments to pass to the method
+
+        Returns:
+            Result of the method execution
+        """
+        if method in _READ_METHODS or self.on_write is None:
+            return await self._execute_kw(model, method, args, kwargs)
+        try:
+            return await self._execute_kw(model, method, args, kwargs)
+        finally:
+            # Also after a failure: Odoo may have applied the call anyway
+            self.on_write(model)
+
+    async def _execute_kw(self, model, method, args, kwargs):
+        """Send one execute_kw call, logging in first if needed"""
+        uid = self.uid
+        logged_in = uid is None
+        if logged_in:
+            uid = await self.authenticate()
+        # Writes are not retried: a timeout does not mean Odoo did not apply them
+        max_retries = 3 if method in _READ_METHODS else 1
+        try:
+            return await self._call(
+                "object",
+                "execute_kw",
+                (self.db, uid, self.password, model, method, list(args), kwargs),
+                max_retries,
+            )
+        except xmlrpc.client.Fault as e:
+            if logged_in or not _is_access_denied(e):
+                raise
+
+        # The login reused from elsewhere (e.g. the sync client) is no longer
+        # valid: log in again and resend once (Odoo rejected the call, so
+        # this is safe)
+        async with self._auth_lock:
+            if self.uid == uid:
+                self.uid = None
+        uid = await self.authenticate()
+        return await self._call(
+            "object",
+            "execute_kw",
+            (self.db, uid, self.password, model, method, list(args), kwargs),
+            max_retries,
+        )
+
+    async def search_read(
+        self, model_name, domain, fields=None, offset=None, limit=None, order=None
+    ):
+        """
+        Search for records and read their data in a single call
+
+        Args:
+            model_name: Name of the model (e.g., 'res.partner')
+            domain: Search domain (e.g., [('is_company', '=', True)])
+            fields: List of field names to return (None for all)
+            offset: Number of records to skip
+            limit: Maximum number of records to return
+            order: Sorting criteria (e.g., 'name ASC, id DESC')
+
+        Returns:
+            List of dictionaries with the matching records
+        """
+        try:
+            kwargs = {}
+            if offset:
+                kwargs["offset"] = offset
+            if fields is not None:
+                kwargs["fields"] = fields
+            if limit is not None:
+                kwargs["limit"] = limit
+            if order is not None:
+                kwargs["order"] = order
+
+            return await self.execute_method(
+                model_name, "search_read", domain, **kwargs
+            )
+        except Exception as e:
+            logger.error("Error in search_read: %s", e)
+            return []
+
+    async def aclose(self):
+        """Close all pooled connections"""
+        await self._http.aclose()
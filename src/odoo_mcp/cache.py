@@ -0,0 +1,101 @@
+"""
+Caches for Odoo metadata used by the MCP server
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class ModelMetadataCache:
+    """
+    Thread-safe LRU cache for model metadata that rarely changes
+
+    Holds things like field definitions, the model list and record IDs of
+    configuration data (e.g. ir.model or mail.activity.type). Every entry
+    expires ``ttl`` seconds after it was fetched, unless a different TTL is
+    given for it; ``float("inf")`` keeps an entry until it is evicted or the
+    cache is cleared.
+    """
+
+    def __init__(self, ttl=3600, maxsize=1024):
+        """
+        Args:
+            ttl: Default number of seconds an entry stays valid
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for ``key``, or ``default`` if it is missing
+        or expired
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and now < entry[0]:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return default
+
+    def set(self, key, value, ttl=None):
+        """
+        Store ``value`` under ``key``
+
+        Args:
+            key: Hashable cache key
+            value: Value to cache
+            ttl: Seconds the value stays valid (default: ``self.ttl``)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_fetch(self, key, fetcher, ttl=None):
+        """
+        Return the cached value for ``key``, calling ``fetcher()`` on a miss
+
+        Exceptions raised by ``fetcher`` are passed on and nothing is cached.
+
+        Args:
+            key: Hashable cache key
+            fetcher: Callable without arguments returning the value
+            ttl: Seconds the fetched value stays valid (default: ``self.ttl``)
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # Fetch outside the lock so slow RPCs do not block other lookups
+            value = fetcher()
+            self.set(key, value, ttl)
+        return value
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """
+        Return cache statistics
+
+        Returns:
+            dict: Number of hits, misses and entries currently stored
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._data)}
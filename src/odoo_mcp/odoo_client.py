@@ -2,15 +2,224 @@
 Odoo XML-RPC client for MCP server integration
 """
 
-import json
+import copy
+import functools
+import hashlib
+import io
+import itertools
+import logging
 import os
-import re
+import random
 import socket
+import ssl
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
 
 import http.client
 import xmlrpc.client
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import ModelMetadataCache
+
+# orjson is an optional, faster drop-in for parsing JSON
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+logger = logging.getLogger(__name__)
+
+# Resolved addresses keyed by hostname: {hostname: (ip, resolved_at)}
+_DNS_CACHE: dict[str, tuple[str, float]] = {}
+
+
+def resolve(host, ttl=60):
+    """
+    Resolve a hostname to an IP address, caching the result for ``ttl`` seconds
+
+    Args:
+        host: Hostname (without port) to resolve
+        ttl: Number of seconds a cached address stays valid
+
+    Returns:
+        IP address string for the host
+    """
+    now = time.monotonic()
+    cached = _DNS_CACHE.get(host)
+    if cached and now - cached[1] < ttl:
+        return cached[0]
+
+    addrinfo = socket.getaddrinfo(host, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    ip = addrinfo[0][4][0]
+    _DNS_CACHE[host] = (ip, now)
+    return ip
+
+
+# User IDs of recent logins, shared by all clients of this process:
+# {(url, db, username, password_hash): (uid, logged_in_at)}
+_UID_CACHE: dict[tuple, tuple[int, float]] = {}
+_UID_CACHE_TTL = 600
+
+
+def _is_access_denied(fault):
+    """Whether an Odoo fault reports a rejected login"""
+    return fault.faultCode == 3 or "Access Denied" in str(fault.faultString)
+
+
+# Methods that only read data, and are therefore safe to send again
+_READ_METHODS = frozenset(
+    {
+        "fields_get",
+        "name_get",
+        "name_search",
+        "read",
+        "search",
+        "search_count",
+        "search_read",
+    }
+)
+
+# Field attributes returned by OdooClient.get_model_fields() by default
+FIELD_ATTRIBUTES = (
+    "type",
+    "string",
+    "required",
+    "readonly",
+    "relation",
+    "help",
+    "selection",
+)
+
+# Read methods whose results OdooClient caches for a short time
+_CACHEABLE_METHODS = frozenset(
+    {"fields_get", "name_get", "read", "search", "search_read"}
+)
+
+# Gateway errors worth retrying: the request did not reach Odoo
+_RETRY_HTTP_CODES = (502, 503, 504)
+
+
+def _backoff_delay(attempt, base=1.0, cap=30.0):
+    """Seconds to wait before retry ``attempt``: capped exponential plus jitter"""
+    return min(cap, base * 2**attempt) * (1 + random.random() * 0.5)
+
+
+def _with_retry(fn, *args, max_retries=3, base=1.0, cap=30.0, **kwargs):
+    """
+    Call ``fn``, retrying transient network errors with exponential backoff
+
+    The delay before attempt ``n`` is ``min(cap, base * 2**n)`` plus up to 50%
+    random jitter. XML-RPC faults are raised immediately: Odoo did process
+    the request, so sending it again is not safe.
+
+    Args:
+        fn: Callable to invoke
+        *args: Positional arguments for ``fn``
+        max_retries: Total number of attempts
+        base: Delay in seconds before the first retry
+        cap: Upper bound for the delay in seconds
+        **kwargs: Keyword arguments for ``fn``
+
+    Returns:
+        Result of ``fn``
+    """
+    for attempt in range(max_retries):
+        try:
+            return fn(*args, **kwargs)
+        except xmlrpc.client.Fault:
+            raise
+        except xmlrpc.client.ProtocolError as e:
+            if e.errcode not in _RETRY_HTTP_CODES or attempt == max_retries - 1:
+                raise
+            error = e
+        except (
+            socket.timeout,
+            ConnectionError,
+            # Raised by SessionTransport, whose adapter leaves retries to us
+            requests.ConnectionError,
+            requests.Timeout,
+        ) as e:
+            if attempt == max_retries - 1:
+                raise
+            error = e
+
+        delay = _backoff_delay(attempt, base, cap)
+        logger.warning("Request failed (%s), retrying in %.1fs", error, delay)
+        time.sleep(delay)
+
+
+def _create_connection(
+    address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None
+):
+    """
+    socket.create_connection replacement that resolves via the DNS cache
+
+    TCP keepalive lets a dead peer be noticed before a pooled connection is
+    reused. (http.client already disables Nagle's algorithm on connect.)
+    """
+    host, port = address
+    sock = socket.create_connection((resolve(host), port), timeout, source_address)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+    return sock
+
+
+class _ResponseCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl`` seconds"""
+
+    def __init__(self, maxsize=1024, ttl=30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Incremented by clear(), see set()
+        self.generation = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key``, or ``default`` if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, generation=None):
+        """
+        Store ``value`` under ``key``, evicting the least recently used entry
+
+        If ``generation`` is given and the cache was cleared since it was
+        read, the value may predate a write and is not stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+
+
+# Marks a cache miss, since None is a valid Odoo result
+_MISSING = object()
+
 
 class OdooClient:
     """Client for interacting with Odoo via XML-RPC"""
@@ -23,6 +232,11 @@ class OdooClient:
         password,
         timeout=10,
         verify_ssl=True,
+        use_session=False,
+        cache_ttl=0,
+        cache_size=1024,
+        protocol="xmlrpc",
+        metadata_ttl=3600,
     ):
         """
         Initialize the Odoo client with connection parameters
@@ -34,9 +248,22 @@ class OdooClient:
             password: Login password
             timeout: Connection timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            use_session: Send requests through a pooled requests.Session
+                instead of the built-in keep-alive transport
+            cache_ttl: Seconds to cache results of read methods (default: 0,
+                disabled). Any write through this client clears the cache, but
+                changes made elsewhere go unnoticed until entries expire.
+            cache_size: Maximum number of cached results
+            protocol: "xmlrpc", or "jsonrpc" to use Odoo's /jsonrpc endpoint,
+                which is cheaper to decode for large reads
+            metadata_ttl: Seconds to cache the model list and field
+                definitions (0 disables)
         """
+        if protocol not in ("xmlrpc", "jsonrpc"):
+            raise ValueError(f"Unsupported protocol: {protocol}")
+
         # Ensure URL has a protocol
-        if not re.match(r"^https?://", url):
+        if not url.startswith(("http://", "https://")):
             url = f"http://{url}"
 
         # Remove trailing slash from URL if present
@@ -46,73 +273,290 @@ class OdooClient:
         self.db = db
         self.username = username
         self.password = password
-        self.uid = None
+        # Logged in on first use, see the uid property
+        self._uid = None
+        self._uid_cached = False
+        self._auth_lock = threading.Lock()
+        self._login_key = (
+            url,
+            db,
+            username,
+            hashlib.blake2b(password.encode()).hexdigest(),
+        )
 
         # Set timeout and SSL verification
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.use_session = use_session
+        self.protocol = protocol
+
+        # Short-lived cache for read-only calls, see _execute()
+        self._cache = _ResponseCache(cache_size, cache_ttl) if cache_ttl > 0 else None
+        # Model list, fields_get results and other metadata change rarely
+        # and are kept longer
+        self.metadata_cache = ModelMetadataCache(metadata_ttl, cache_size)
 
         # Setup connections
+        self._transport = None
         self._common = None
         self._models = None
+        self._exec_kw = None
+        # Set when a call failed at the network level; see get_odoo_client()
+        self._connection_failed = False
 
-        # Parse hostname for logging
-        parsed_url = urllib.parse.urlparse(self.url)
+        # Parse the URL once and keep the pieces needed on the request path
+        parsed_url = urllib.parse.urlsplit(self.url)
         self.hostname = parsed_url.netloc
+        self._scheme = parsed_url.scheme
+        self._host = parsed_url.hostname
+        self._port = parsed_url.port
+        self._common_endpoint = f"{self.url}/xmlrpc/2/common"
+        self._object_endpoint = f"{self.url}/xmlrpc/2/object"
+        self._jsonrpc_endpoint = f"{self.url}/jsonrpc"
 
         # Connect
-        self._connect()
-
-    def _connect(self):
-        """Initialize the XML-RPC connection and authenticate"""
+        self._build_transport()
+
+    @property
+    def uid(self):
+        """User ID of the login, authenticating first if not logged in yet"""
+        if self._uid is None:
+            self._authenticate()
+        return self._uid
+
+    @property
+    def logged_in_uid(self):
+        """User ID of the current login, or None if not logged in yet"""
+        return self._uid
+
+    def _build_transport(self):
+        """Initialize the connection to the Odoo server"""
         # Tạo transport với timeout phù hợp
-        is_https = self.url.startswith("https://")
-        transport = RedirectTransport(
-            timeout=self.timeout, use_https=is_https, verify_ssl=self.verify_ssl
-        )
+        self.close()
+        transport = self._make_transport(self.timeout)
+        self._transport = transport
+        self._connection_failed = False
 
-        print(f"Connecting to Odoo at: {self.url}", file=os.sys.stderr)
-        print(f"  Hostname: {self.hostname}", file=os.sys.stderr)
-        print(
-            f"  Timeout: {self.timeout}s, Verify SSL: {self.verify_ssl}",
-            file=os.sys.stderr,
-        )
+        logger.info("Connecting to Odoo at: %s", self.url)
+        logger.debug("  Hostname: %s", self.hostname)
+        logger.debug("  Timeout: %ss, Verify SSL: %s", self.timeout, self.verify_ssl)
 
         # Thiết lập endpoints
-        self._common = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/common", transport=transport
-        )
-        self._models = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/object", transport=transport
+        self._common = None
+        self._models = self._server_proxy("object", transport)
+        # Bound once so each call skips ServerProxy.__getattr__
+        self._exec_kw = self._models.execute_kw
+
+    def _authenticate(self):
+        """Log in and store the user ID; concurrent callers share one login"""
+        with self._auth_lock:
+            if self._uid is not None:
+                return
+
+            # Another client of this process may have logged in already
+            cached = _UID_CACHE.get(self._login_key)
+            if cached and time.monotonic() - cached[1] < _UID_CACHE_TTL:
+                self._uid = cached[0]
+                self._uid_cached = True
+                return
+
+            # Xác thực và lấy user ID
+            logger.info(
+                "Authenticating with database: %s, username: %s",
+                self.db,
+                self.username,
+            )
+            try:
+                uid = _with_retry(
+                    self._get_common().authenticate,
+                    self.db,
+                    self.username,
+                    self.password,
+                    {},
+                )
+                if not uid:
+                    raise ValueError(
+                        "Authentication failed: Invalid username or password"
+                    )
+                self._uid = uid
+                _UID_CACHE[self._login_key] = (uid, time.monotonic())
+                # Only needed to log in; rebuilt on demand by _get_common()
+                self._common = None
+            except (socket.error, socket.timeout, ConnectionError, TimeoutError) as e:
+                logger.error("Connection error: %s", e)
+                raise ConnectionError(f"Failed to connect to Odoo server: {str(e)}")
+            except Exception as e:
+                logger.error("Authentication error: %s", e)
+                raise ValueError(f"Failed to authenticate with Odoo: {str(e)}")
+
+    def _forget_login(self):
+        """Drop the user ID so the next call logs in again"""
+        with self._auth_lock:
+            _UID_CACHE.pop(self._login_key, None)
+            self._uid = None
+            self._uid_cached = False
+
+    def _make_transport(self, timeout):
+        """Create the transport configured for this client"""
+        if self.protocol == "jsonrpc":
+            transport_class = JsonRpcTransport
+        elif self.use_session:
+            transport_class = SessionTransport
+        else:
+            transport_class = RedirectTransport
+        return transport_class(
+            timeout=timeout,
+            use_https=self._scheme == "https",
+            verify_ssl=self.verify_ssl,
         )
 
-        # Xác thực và lấy user ID
-        print(
-            f"Authenticating with database: {self.db}, username: {self.username}",
-            file=os.sys.stderr,
-        )
+    def _server_proxy(self, service, transport):
+        """Create a proxy for the "common" or "object" service"""
+        if self.protocol == "jsonrpc":
+            return JsonRpcProxy(self._jsonrpc_endpoint, service, transport)
+        if service == "common":
+            endpoint = self._common_endpoint
+        else:
+            endpoint = self._object_endpoint
+        return xmlrpc.client.ServerProxy(endpoint, transport=transport)
+
+    def ping(self, timeout=2):
+        """
+        Check whether the Odoo server answers
+
+        Calls the cheap common.version() method over a separate short-timeout
+        transport, so a dead server is detected quickly.
+
+        Returns:
+            True if the server responded, False otherwise
+        """
+        transport = self._make_transport(timeout)
         try:
-            print(
-                f"Making request to {self.hostname}/xmlrpc/2/common (attempt 1)",
-                file=os.sys.stderr,
-            )
-            self.uid = self._common.authenticate(
-                self.db, self.username, self.password, {}
-            )
-            if not self.uid:
-                raise ValueError("Authentication failed: Invalid username or password")
-        except (socket.error, socket.timeout, ConnectionError, TimeoutError) as e:
-            print(f"Connection error: {str(e)}", file=os.sys.stderr)
-            raise ConnectionError(f"Failed to connect to Odoo server: {str(e)}")
+            self._server_proxy("common", transport).version()
+            return True
         except Exception as e:
-            print(f"Authentication error: {str(e)}", file=os.sys.stderr)
-            raise ValueError(f"Failed to authenticate with Odoo: {str(e)}")
+            logger.debug("Ping failed: %s", e)
+            return False
+        finally:
+            transport.close()
+
+    def _get_common(self):
+        """Return the proxy for the common endpoint, creating it if needed"""
+        if self._common is None:
+            self._common = self._server_proxy("common", self._transport)
+        return self._common
+
+    def close(self):
+        """Close the persistent connections to the Odoo server"""
+        if isinstance(self._transport, RedirectTransport):
+            self._transport.close_all()
+        elif self._transport is not None:
+            self._transport.close()
+
+    def invalidate_cache(self):
+        """Forget all cached read results"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def invalidate_metadata(self):
+        """Forget the cached model list, field definitions and other metadata"""
+        self.metadata_cache.clear()
+
+    def invalidate_for_write(self, model):
+        """
+        Forget cached data that a write to ``model`` may have made stale
+
+        Called for every non-read method sent through this client, and by an
+        AsyncOdooClient created with from_client() for the calls it sends.
+        """
+        self.invalidate_cache()
+        # Writes to ir.model* change the model list and field definitions
+        if model.startswith("ir.model"):
+            self.invalidate_metadata()
+
+    def _cached_metadata(self, key, fetch):
+        """Return ``fetch()``, cached in the metadata cache under ``key``"""
+        # Callers may modify what they get back, so never hand out the cached object
+        return copy.deepcopy(self.metadata_cache.get_or_fetch(key, fetch))
 
     def _execute(self, model, method, *args, **kwargs):
-        """Execute a method on an Odoo model"""
-        return self._models.execute_kw(
-            self.db, self.uid, self.password, model, method, args, kwargs
-        )
+        """
+        Execute a method on an Odoo model
+
+        Results of read methods are served from a short-lived cache, if
+        enabled; any other method may change data, so it clears the cache.
+        """
+        if self._cache is None or method not in _CACHEABLE_METHODS:
+            if method in _READ_METHODS:
+                return self._execute_kw(model, method, args, kwargs)
+            try:
+                return self._execute_kw(model, method, args, kwargs)
+            finally:
+                # Only once the write is done, and also after a failure:
+                # Odoo may have applied it anyway
+                self.invalidate_for_write(model)
+
+        key = (model, method, repr(args), repr(sorted(kwargs.items())))
+        return self._cached_execute_kw(key, model, method, args, kwargs)
+
+    def _cached_execute_kw(self, key, model, method, args, kwargs):
+        """
+        Send a read call, or serve its result from the cache under ``key``
+
+        A hit returns a copy of the cached result. A miss returns the result
+        it stores without copying it, so callers must not modify results of
+        cached reads in place (the resources only serialize them).
+        """
+        if self._cache is None:
+            return self._execute_kw(model, method, args, kwargs)
+
+        result = self._cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return copy.deepcopy(result)
+
+        # A write finishing while this read is in flight clears the cache;
+        # the result may then predate it and is not stored
+        generation = self._cache.generation
+        result = self._execute_kw(model, method, args, kwargs)
+        self._cache.set(key, result, generation)
+        return result
+
+    def _execute_read(self, model, ids, fields=None):
+        """Fast path for ``read``, skipping the generic packing of _execute"""
+        kwargs = {} if fields is None else {"fields": fields}
+        key = (model, "read", tuple(ids), None if fields is None else tuple(fields))
+        return self._cached_execute_kw(key, model, "read", [ids], kwargs)
+
+    def _execute_search_read(self, model, domain, kwargs):
+        """Fast path for ``search_read``, skipping the generic packing of _execute"""
+        key = (model, "search_read", repr(domain), repr(sorted(kwargs.items())))
+        return self._cached_execute_kw(key, model, "search_read", [domain], kwargs)
+
+    def _execute_kw(self, model, method, args, kwargs):
+        """Send a single execute_kw call to the Odoo server"""
+        try:
+            # Writes are not retried: a timeout does not mean Odoo did not apply them
+            return _with_retry(
+                self._exec_kw,
+                self.db,
+                self.uid,
+                self.password,
+                model,
+                method,
+                args,
+                kwargs,
+                max_retries=3 if method in _READ_METHODS else 1,
+            )
+        except xmlrpc.client.Fault as e:
+            if not (self._uid_cached and _is_access_denied(e)):
+                raise
+            # The login reused from _UID_CACHE is no longer valid: log in
+            # again and resend once (Odoo rejected the call, so this is safe)
+            self._forget_login()
+            return self._execute_kw(model, method, args, kwargs)
+        except OSError:
+            self._connection_failed = True
+            raise
 
     def execute_method(self, model, method, *args, **kwargs):
         """
@@ -145,36 +589,37 @@ class OdooClient:
             ['res.partner', 'res.users', 'res.company', 'res.groups', 'ir.model']
         """
         try:
-            # First search for model IDs
-            model_ids = self._execute("ir.model", "search", [])
+            result = self._cached_metadata("ir.model", self._read_models)
 
-            if not model_ids:
+            if not result:
                 return {
                     "model_names": [],
                     "models_details": {},
                     "error": "No models found",
                 }
 
-            # Then read the model data with only the most basic fields
-            # that are guaranteed to exist in all Odoo versions
-            result = self._execute("ir.model", "read", model_ids, ["model", "name"])
-
-            # Extract and sort model names alphabetically
-            models = sorted([rec["model"] for rec in result])
-
-            # For more detailed information, include the full records
-            models_info = {
-                "model_names": models,
-                "models_details": {
-                    rec["model"]: {"name": rec.get("name", "")} for rec in result
-                },
-            }
+            # Collect model names and details in one pass over the records
+            models = []
+            details = {}
+            for rec in result:
+                model = rec["model"]
+                models.append(model)
+                details[model] = {"name": rec.get("name", "")}
+            models.sort()
 
-            return models_info
+            return {"model_names": models, "models_details": details}
         except Exception as e:
-            print(f"Error retrieving models: {str(e)}", file=os.sys.stderr)
+            logger.error("Error retrieving models: %s", e)
             return {"model_names": [], "models_details": {}, "error": str(e)}
 
+    def _read_models(self):
+        """Read the name of every model from ir.model"""
+        # Search and read in one round-trip, with only the most basic fields
+        # that are guaranteed to exist in all Odoo versions
+        return self._execute_kw(
+            "ir.model", "search_read", [[]], {"fields": ["model", "name"]}
+        )
+
     def get_model_info(self, model_name):
         """
         Get information about a specific model
@@ -192,11 +637,14 @@ class OdooClient:
             'Contact'
         """
         try:
-            result = self._execute(
-                "ir.model",
-                "search_read",
-                [("model", "=", model_name)],
-                {"fields": ["name", "model"]},
+            result = self._cached_metadata(
+                ("ir.model", model_name),
+                lambda: self._execute_kw(
+                    "ir.model",
+                    "search_read",
+                    [[("model", "=", model_name)]],
+                    {"fields": ["name", "model"]},
+                ),
             )
 
             if not result:
@@ -204,15 +652,20 @@ class OdooClient:
 
             return result[0]
         except Exception as e:
-            print(f"Error retrieving model info: {str(e)}", file=os.sys.stderr)
+            logger.error("Error retrieving model info: %s", e)
             return {"error": str(e)}
 
-    def get_model_fields(self, model_name):
+    def get_model_fields(self, model_name, attributes=None):
         """
         Get field definitions for a specific model
 
+        Only the requested field attributes are returned, which spares Odoo
+        from loading costly ones (e.g. translated labels) nobody reads.
+
         Args:
             model_name: Name of the model (e.g., 'res.partner')
+            attributes: Field attributes to return (default:
+                FIELD_ATTRIBUTES)
 
         Returns:
             Dictionary mapping field names to their definitions
@@ -223,11 +676,16 @@ class OdooClient:
             >>> print(fields['name']['type'])
             'char'
         """
+        attributes = list(attributes or FIELD_ATTRIBUTES)
         try:
-            fields = self._execute(model_name, "fields_get")
-            return fields
+            return self._cached_metadata(
+                ("fields_get", model_name, tuple(attributes)),
+                lambda: self._execute_kw(
+                    model_name, "fields_get", [], {"attributes": attributes}
+                ),
+            )
         except Exception as e:
-            print(f"Error retrieving fields: {str(e)}", file=os.sys.stderr)
+            logger.error("Error retrieving fields: %s", e)
             return {"error": str(e)}
 
     def search_read(
@@ -264,10 +722,9 @@ class OdooClient:
             if order is not None:
                 kwargs["order"] = order
 
-            result = self._execute(model_name, "search_read", domain, kwargs)
-            return result
+            return self._execute_search_read(model_name, domain, kwargs)
         except Exception as e:
-            print(f"Error in search_read: {str(e)}", file=os.sys.stderr)
+            logger.error("Error in search_read: %s", e)
             return []
 
     def read_records(self, model_name, ids, fields=None):
@@ -289,97 +746,346 @@ class OdooClient:
             'YourCompany'
         """
         try:
-            kwargs = {}
-            if fields is not None:
-                kwargs["fields"] = fields
-
-            result = self._execute(model_name, "read", ids, kwargs)
-            return result
+            return self._execute_read(model_name, ids, fields)
         except Exception as e:
-            print(f"Error reading records: {str(e)}", file=os.sys.stderr)
+            logger.error("Error reading records: %s", e)
             return []
 
 
 class RedirectTransport(xmlrpc.client.Transport):
-    """Transport that adds timeout, SSL verification, and redirect handling"""
+    """
+    Transport that adds timeout, SSL verification, and redirect handling
+
+    The underlying HTTP(S) connection is kept open between calls (HTTP/1.1
+    keep-alive), so only the first request to a host pays the TCP and TLS
+    handshakes. The standard Transport closes it again after a failed request
+    and retries once if the server dropped an idle connection.
+    Each thread gets its own connection, since an http.client connection
+    cannot carry two requests at once, so concurrent callers (e.g. tools run
+    with asyncio.to_thread) use a pool of connections in parallel.
+    """
 
     def __init__(
         self, timeout=10, use_https=True, verify_ssl=True, max_redirects=5, proxy=None
     ):
-        super().__init__()
+        self._local = threading.local()
+        # Connections of all threads, so close() can release every one
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        super().__init__(headers=[("Connection", "keep-alive")])
         self.timeout = timeout
         self.use_https = use_https
         self.verify_ssl = verify_ssl
         self.max_redirects = max_redirects
         self.proxy = proxy or os.environ.get("HTTP_PROXY")
 
-        if use_https and not verify_ssl:
-            import ssl
+        # Built once and shared by every HTTPS connection of this transport
+        self._ssl_context = None
+        if use_https:
+            if verify_ssl:
+                self._ssl_context = ssl.create_default_context()
+            else:
+                self._ssl_context = ssl._create_unverified_context()
+
+    @property
+    def _connection(self):
+        return getattr(self._local, "connection", (None, None))
 
-            self.context = ssl._create_unverified_context()
+    @_connection.setter
+    def _connection(self, value):
+        self._local.connection = value
 
     def make_connection(self, host):
+        # Reuse the open connection while we keep talking to the same host
+        if self._connection and host == self._connection[0]:
+            return self._connection[1]
+        # A different host (e.g. after a redirect): drop the stale connection
+        self.close()
+
+        # A larger blocksize sends big request bodies with fewer send() calls
+        options = {"timeout": self.timeout, "blocksize": 65536}
+        if self.use_https:
+            connection_class = http.client.HTTPSConnection
+            options["context"] = self._ssl_context
+        else:
+            connection_class = http.client.HTTPConnection
+
         if self.proxy:
             proxy_url = urllib.parse.urlparse(self.proxy)
-            connection = http.client.HTTPConnection(
-                proxy_url.hostname, proxy_url.port, timeout=self.timeout
-            )
+            connection = connection_class(proxy_url.hostname, proxy_url.port, **options)
             connection.set_tunnel(host)
         else:
-            if self.use_https and not self.verify_ssl:
-                connection = http.client.HTTPSConnection(
-                    host, timeout=self.timeout, context=self.context
-                )
-            else:
-                if self.use_https:
-                    connection = http.client.HTTPSConnection(host, timeout=self.timeout)
-                else:
-                    connection = http.client.HTTPConnection(host, timeout=self.timeout)
-
+            connection = connection_class(host, **options)
+
+        # Connect to the cached IP; the original hostname is kept on the
+        # connection so the Host header, TLS SNI and certificate checks match
+        connection._create_connection = _create_connection
+        self._connection = host, connection
+        with self._connections_lock:
+            self._connections.add(connection)
         return connection
 
+    def close(self):
+        """Close the calling thread's connection"""
+        connection = self._connection[1]
+        if connection:
+            with self._connections_lock:
+                self._connections.discard(connection)
+        super().close()
+
+    def close_all(self):
+        """Close the connections of every thread"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, set()
+        self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
     def request(self, host, handler, request_body, verbose):
         """Send HTTP request with retry for redirects"""
-        redirects = 0
-        while redirects < self.max_redirects:
-            try:
-                print(f"Making request to {host}{handler}", file=os.sys.stderr)
-                return super().request(host, handler, request_body, verbose)
-            except xmlrpc.client.ProtocolError as err:
-                if err.errcode in (301, 302, 303, 307, 308) and err.headers.get(
-                    "location"
-                ):
-                    redirects += 1
-                    location = err.headers.get("location")
-                    parsed = urllib.parse.urlparse(location)
-                    if parsed.netloc:
-                        host = parsed.netloc
-                    handler = parsed.path
-                    if parsed.query:
-                        handler += "?" + parsed.query
-                else:
-                    raise
-            except Exception as e:
-                print(f"Error during request: {str(e)}", file=os.sys.stderr)
+        return _follow_redirects(
+            lambda host, handler: self._request_once(
+                host, handler, request_body, verbose
+            ),
+            host,
+            handler,
+            self.max_redirects,
+        )
+
+    def _request_once(self, host, handler, request_body, verbose):
+        """Send the request to ``host``, without following redirects"""
+        try:
+            logger.debug("Making request to %s%s", host, handler)
+            return super().request(host, handler, request_body, verbose)
+        except xmlrpc.client.ProtocolError:
+            raise
+        except Exception as e:
+            logger.debug("Error during request: %s", e)
+            raise
+
+
+def _follow_redirects(send, host, handler, max_redirects):
+    """
+    Call ``send(host, handler)``, sending the request again to the new
+    location whenever it raises a redirect
+
+    Redirects are followed here rather than by the HTTP library, which would
+    turn a redirected POST into a GET that Odoo's RPC endpoints reject.
+    """
+    redirects = 0
+    while redirects < max_redirects:
+        try:
+            return send(host, handler)
+        except xmlrpc.client.ProtocolError as err:
+            # xmlrpc.client passes the headers as a plain dict, so match the
+            # name case-insensitively
+            location = next(
+                (v for k, v in err.headers.items() if k.lower() == "location"), None
+            )
+            if err.errcode in (301, 302, 303, 307, 308) and location:
+                redirects += 1
+                parsed = urllib.parse.urlparse(location)
+                if parsed.netloc:
+                    host = parsed.netloc
+                handler = parsed.path
+                if parsed.query:
+                    handler += "?" + parsed.query
+            else:
                 raise
 
-        raise xmlrpc.client.ProtocolError(host + handler, 310, "Too many redirects", {})
+    raise xmlrpc.client.ProtocolError(host + handler, 310, "Too many redirects", {})
+
+
+class SessionTransport(xmlrpc.client.Transport):
+    """
+    Transport that sends XML-RPC requests through a pooled requests.Session
+
+    urllib3 takes care of connection pooling, keep-alive and gzip decoding.
+    It only retries failed connection attempts, which never reached Odoo;
+    every other retry is left to OdooClient, which never resends writes.
+    """
+
+    def __init__(
+        self, timeout=10, use_https=True, verify_ssl=True, max_redirects=5, proxy=None
+    ):
+        super().__init__()
+        self.timeout = timeout
+        self.scheme = "https" if use_https else "http"
+        self.verify_ssl = verify_ssl
+        self.max_redirects = max_redirects
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            # Enough for every worker thread asyncio.to_thread() may use
+            pool_maxsize=32,
+            max_retries=Retry(connect=3, read=0, status=0, backoff_factor=0.5),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        proxy = proxy or os.environ.get("HTTP_PROXY")
+        if proxy:
+            self.session.proxies = {"http": proxy, "https": proxy}
+
+    def _post(self, host, handler, body, headers):
+        """
+        POST ``body`` to ``host`` without following redirects
+
+        Raises:
+            xmlrpc.client.ProtocolError: If the response status is not 200
+        """
+        response = self.session.post(
+            f"{self.scheme}://{host}{handler}",
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            verify=self.verify_ssl,
+            # Followed by _follow_redirects(), which keeps the POST
+            allow_redirects=False,
+        )
+        if response.status_code != 200:
+            raise xmlrpc.client.ProtocolError(
+                host + handler,
+                response.status_code,
+                response.reason,
+                dict(response.headers),
+            )
+        return response
+
+    def request(self, host, handler, request_body, verbose=False):
+        """Send the XML-RPC request and parse the response"""
+        headers = {"Content-Type": "text/xml", "User-Agent": self.user_agent}
+        response = _follow_redirects(
+            lambda host, handler: self._post(host, handler, request_body, headers),
+            host,
+            handler,
+            self.max_redirects,
+        )
+
+        self.verbose = verbose
+        return self.parse_response(io.BytesIO(response.content))
 
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
 
+
+class JsonRpcTransport(SessionTransport):
+    """
+    Transport for Odoo's JSON-RPC endpoint
+
+    Shares the pooled session of SessionTransport; responses are decoded with
+    orjson when it is installed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ids = itertools.count(1)
+
+    def call(self, url, service, method, args):
+        """
+        Call ``service.method(*args)`` and return its result
+
+        Raises:
+            xmlrpc.client.Fault: If Odoo returned an error
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": args},
+            "id": next(self._ids),
+        }
+        logger.debug("Making request to %s (%s.%s)", url, service, method)
+        body = _json.dumps(payload)
+        headers = {"Content-Type": "application/json"}
+        parsed = urllib.parse.urlsplit(url)
+        response = _follow_redirects(
+            lambda host, handler: self._post(host, handler, body, headers),
+            parsed.netloc,
+            parsed.path,
+            self.max_redirects,
+        )
+
+        reply = _json.loads(response.content)
+        error = reply.get("error")
+        if error:
+            # Surface errors like XML-RPC faults so callers handle both alike
+            data = error.get("data") or {}
+            raise xmlrpc.client.Fault(
+                error.get("code", 1), data.get("message") or error.get("message")
+            )
+        return reply.get("result")
+
+
+class JsonRpcProxy:
+    """Calls methods of one Odoo JSON-RPC service, like xmlrpc.client.ServerProxy"""
+
+    def __init__(self, url, service, transport):
+        self._url = url
+        self._service = service
+        self._transport = transport
+
+    def __getattr__(self, method):
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        def call(*args):
+            return self._transport.call(self._url, self._service, method, list(args))
+
+        return call
+
+
+# Config file paths to check, in order
+CONFIG_PATHS = (
+    "./odoo_config.json",
+    os.path.expanduser("~/.config/odoo/config.json"),
+    os.path.expanduser("~/.odoo_config.json"),
+)
+
+# Environment variables echoed at startup (the password is never printed)
+LOGGED_ENV_VARS = (
+    "ODOO_URL",
+    "ODOO_DB",
+    "ODOO_USERNAME",
+    "ODOO_TIMEOUT",
+    "ODOO_VERIFY_SSL",
+    "ODOO_USE_SESSION",
+    "ODOO_CACHE_TTL",
+    "ODOO_METADATA_TTL",
+    "ODOO_PROTOCOL",
+    "ODOO_LOG_LEVEL",
+)
+
+# Level of the odoo_mcp loggers when ODOO_LOG_LEVEL is not set
+DEFAULT_LOG_LEVEL = "INFO"
+
+
+def configure_logging():
+    """
+    Set the level of the odoo_mcp loggers from ODOO_LOG_LEVEL
+
+    Called by every entry point. DEBUG traces each Odoo request, so it is
+    not the default. httpx logs each request at INFO and is limited to
+    warnings.
+    """
+    level = os.environ.get("ODOO_LOG_LEVEL", DEFAULT_LOG_LEVEL).upper()
+    logging.getLogger("odoo_mcp").setLevel(level)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+@functools.lru_cache(maxsize=1)
 def load_config():
     """
     Load Odoo configuration from environment variables or config file
 
+    The result is cached for the life of the process; call
+    ``load_config.cache_clear()`` to pick up changed settings. Do not modify
+    the returned dictionary.
+
     Returns:
         dict: Configuration dictionary with url, db, username, password
     """
-    # Define config file paths to check
-    config_paths = [
-        "./odoo_config.json",
-        os.path.expanduser("~/.config/odoo/config.json"),
-        os.path.expanduser("~/.odoo_config.json"),
-    ]
-
     # Try environment variables first
     if all(
         var in os.environ
@@ -393,39 +1099,98 @@ def load_config():
         }
 
     # Try to load from file
-    for path in config_paths:
-        expanded_path = os.path.expanduser(path)
-        if os.path.exists(expanded_path):
-            with open(expanded_path, "r") as f:
-                return json.load(f)
+    for path in CONFIG_PATHS:
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                return _json.loads(f.read())
 
     raise FileNotFoundError(
         "No Odoo configuration found. Please create an odoo_config.json file or set environment variables."
     )
 
 
+# Client shared by the whole process, created by get_odoo_client()
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
 def get_odoo_client():
     """
-    Get a configured Odoo client instance
+    Get the shared Odoo client instance
+
+    The client is created on first use and reused after that; it logs in
+    with its first call. If a previous call failed at the network level and
+    the server answers a ping again, a new client replaces it. The old one
+    is not closed, so calls other threads still have in flight on its
+    connections can finish.
+
+    Returns:
+        OdooClient: A configured Odoo client instance
+    """
+    global _CLIENT
+
+    client = _CLIENT
+    if client is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = _create_odoo_client()
+            return _CLIENT
+
+    if client._connection_failed and client.ping():
+        with _CLIENT_LOCK:
+            if _CLIENT is client:
+                replacement = _create_odoo_client()
+                # Field definitions and the like are still valid
+                replacement.metadata_cache = client.metadata_cache
+                _CLIENT = replacement
+            return _CLIENT
+    return client
+
+
+def _create_odoo_client():
+    """
+    Create a configured Odoo client instance
 
     Returns:
         OdooClient: A configured Odoo client instance
     """
     config = load_config()
 
+    # Warm the DNS cache before the first login; if the lookup fails here the
+    # connection attempt retries it and reports the error
+    url = config["url"]
+    hostname = urllib.parse.urlsplit(url if "://" in url else f"//{url}").hostname
+    if hostname:
+        try:
+            resolve(hostname)
+        except OSError as e:
+            logger.warning("Could not resolve %s at startup: %s", hostname, e)
+
     # Get additional options from environment variables
     timeout = int(
         os.environ.get("ODOO_TIMEOUT", "30")
     )  # Increase default timeout to 30 seconds
     verify_ssl = os.environ.get("ODOO_VERIFY_SSL", "1").lower() in ["1", "true", "yes"]
+    use_session = os.environ.get("ODOO_USE_SESSION", "0").lower() in [
+        "1",
+        "true",
+        "yes",
+    ]
+    cache_ttl = int(os.environ.get("ODOO_CACHE_TTL", "0"))
+    metadata_ttl = int(os.environ.get("ODOO_METADATA_TTL", "3600"))
+    protocol = os.environ.get("ODOO_PROTOCOL", "xmlrpc").lower()
 
     # Print detailed configuration
-    print("Odoo client configuration:", file=os.sys.stderr)
-    print(f"  URL: {config['url']}", file=os.sys.stderr)
-    print(f"  Database: {config['db']}", file=os.sys.stderr)
-    print(f"  Username: {config['username']}", file=os.sys.stderr)
-    print(f"  Timeout: {timeout}s", file=os.sys.stderr)
-    print(f"  Verify SSL: {verify_ssl}", file=os.sys.stderr)
+    logger.debug("Odoo client configuration:")
+    logger.debug("  URL: %s", config["url"])
+    logger.debug("  Database: %s", config["db"])
+    logger.debug("  Username: %s", config["username"])
+    logger.debug("  Timeout: %ss", timeout)
+    logger.debug("  Verify SSL: %s", verify_ssl)
+    logger.debug("  Use session: %s", use_session)
+    logger.debug("  Cache TTL: %ss", cache_ttl)
+    logger.debug("  Metadata TTL: %ss", metadata_ttl)
+    logger.debug("  Protocol: %s", protocol)
 
     return OdooClient(
         url=config["url"],
@@ -434,4 +1199,8 @@ def get_odoo_client():
         password=config["password"],
         timeout=timeout,
         verify_ssl=verify_ssl,
+        use_session=use_session,
+        cache_ttl=cache_ttl,
+        protocol=protocol,
+        metadata_ttl=metadata_ttl,
     )
@@ -4,17 +4,36 @@ MCP server for Odoo integration
 Provides MCP tools and resources for interacting with Odoo ERP systems
 """
 
+import ast
+import asyncio
+import functools
 import json
+import logging
+import re
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, AsyncIterator, Dict, List, Optional, Union, cast
+from operator import attrgetter
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Union
 
 from mcp.server.fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+from mcp.types import ToolAnnotations
+from pydantic import BaseModel, Field, TypeAdapter
 from zoneinfo import ZoneInfo
 
-from .odoo_client import OdooClient, get_odoo_client
+from .async_client import AsyncOdooClient
+from .odoo_client import _READ_METHODS, OdooClient, get_odoo_client
+
+logger = logging.getLogger(__name__)
+
+# orjson is an optional, much faster encoder/decoder for resource payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Email addresses accepted by create_customer and create_lead
+EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
 
 def safe_get_string_field(item: dict, field_name: str) -> Optional[str]:
@@ -25,7 +44,32 @@ def safe_get_string_field(item: dict, field_name: str) -> Optional[str]:
     This function converts False to None for optional string fields.
     """
     value = item.get(field_name)
-    return value if value not in [False, None] else None
+    return None if value is False or value is None else value
+
+
+def set_stripped_fields(data: dict, values) -> None:
+    """
+    Copy (key, value) pairs into data with surrounding whitespace removed.
+
+    Values that are None, empty or only whitespace are skipped.
+    """
+    for key, value in values:
+        if value:
+            value = value.strip()
+            if value:
+                data[key] = value
+
+
+def parse_date(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date, raising ValueError for anything else.
+
+    datetime.fromisoformat() is much faster than strptime() but also accepts
+    other ISO 8601 forms, so the shape is checked first.
+    """
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(f"Invalid date: {value!r}")
+    return datetime.fromisoformat(value)
 
 
 @dataclass
@@ -33,6 +77,12 @@ class AppContext:
     """Application context for the MCP server"""
 
     odoo: OdooClient
+    odoo_async: AsyncOdooClient
+
+
+# Look up the lifespan clients from a tool's Context
+_get_odoo = attrgetter("request_context.lifespan_context.odoo")
+_get_odoo_async = attrgetter("request_context.lifespan_context.odoo_async")
 
 
 @asynccontextmanager
@@ -42,12 +92,29 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """
     # Initialize Odoo client on startup
     odoo_client = get_odoo_client()
+    odoo_async = AsyncOdooClient.from_client(odoo_client)
+    # Log in in the background so startup is not delayed by Odoo
+    warm_up = asyncio.create_task(_warm_up(odoo_client, odoo_async))
 
     try:
-        yield AppContext(odoo=odoo_client)
+        yield AppContext(odoo=odoo_client, odoo_async=odoo_async)
     finally:
-        # No cleanup needed for Odoo client
-        pass
+        warm_up.cancel()
+        # Release the persistent connections to Odoo
+        await odoo_async.aclose()
+        odoo_client.close()
+
+
+async def _warm_up(odoo_client: OdooClient, odoo_async: AsyncOdooClient) -> None:
+    """Log in once and share the user ID between the sync and async clients"""
+    try:
+        uid = await asyncio.to_thread(lambda: odoo_client.uid)
+    except Exception as e:
+        # The first request will retry and report the error
+        logger.warning("Could not log in to Odoo at startup: %s", e)
+        return
+    if odoo_async.uid is None:
+        odoo_async.uid = uid
 
 
 # Create MCP server
@@ -58,50 +125,130 @@ mcp = FastMCP(
     lifespan=app_lifespan,
 )
 
+# Tools that only read from Odoo; batch_execute may run them concurrently
+READ_ONLY = ToolAnnotations(readOnlyHint=True)
+
 
 # ----- MCP Resources -----
 
+# Field attributes included in odoo://model/{model_name}
+MODEL_FIELD_ATTRIBUTES = ("type", "string", "required", "relation", "selection")
+
+# Seconds the rendered odoo://models and odoo://model/{model_name} are reused
+RESOURCE_TTL = 60
+
+# Field types left out of odoo://search results (e.g. base64 images)
+RESOURCE_SKIPPED_TYPES = frozenset({"binary"})
+
+
+def _dumps(obj) -> str:
+    """Serialize a resource result as compact JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# Parser for JSON domains; orjson's errors subclass json.JSONDecodeError
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _resource_client() -> OdooClient:
+    """
+    Return the lifespan-scoped Odoo client for a resource handler
+
+    FastMCP does not inject a Context into resources, so the client is looked
+    up from the current request; outside a request the shared client is used.
+    """
+    try:
+        return _get_odoo(mcp.get_context())
+    except ValueError:
+        return get_odoo_client()
+
+
+def _split_fields(fields: str) -> List[str]:
+    """Split a comma-separated field list from a resource URI"""
+    return [name for name in (part.strip() for part in fields.split(",")) if name]
+
+
+async def _resource_fields(
+    odoo_client: OdooClient, model_name: str
+) -> Optional[List[str]]:
+    """
+    Return the fields of a model worth sending back from a resource
+
+    Uses the same cached field definitions as odoo://model/{model_name}, so
+    no extra fields_get call is made once either resource has read them.
+    Returns None (read every field) if the field definitions are unavailable.
+    """
+    fields = await asyncio.to_thread(
+        odoo_client.get_model_fields, model_name, MODEL_FIELD_ATTRIBUTES
+    )
+    if "error" in fields:
+        return None
+    return [
+        name
+        for name, field in fields.items()
+        if field.get("type") not in RESOURCE_SKIPPED_TYPES
+    ]
+
 
 @mcp.resource(
     "odoo://models", description="List all available models in the Odoo system"
 )
 def get_models() -> str:
     """Lists all available models in the Odoo system"""
-    odoo_client = get_odoo_client()
-    models = odoo_client.get_models()
-    return json.dumps(models, indent=2)
+    odoo_client = _resource_client()
+    key = ("resource", "models")
+    rendered = odoo_client.metadata_cache.get(key)
+    if rendered is None:
+        models = odoo_client.get_models()
+        rendered = _dumps(models)
+        if "error" not in models:
+            odoo_client.metadata_cache.set(key, rendered, ttl=RESOURCE_TTL)
+    return rendered
 
 
 @mcp.resource(
     "odoo://model/{model_name}",
     description="Get detailed information about a specific model including fields",
 )
-def get_model_info(model_name: str) -> str:
+async def get_model_info(model_name: str) -> str:
     """
     Get information about a specific model
 
     Parameters:
         model_name: Name of the Odoo model (e.g., 'res.partner')
     """
-    odoo_client = get_odoo_client()
+    odoo_client = _resource_client()
+    key = ("resource", "model", model_name)
+    rendered = odoo_client.metadata_cache.get(key)
+    if rendered is not None:
+        return rendered
     try:
-        # Get model info
-        model_info = odoo_client.get_model_info(model_name)
+        # Fetch model info and field definitions in parallel
+        model_info, fields = await asyncio.gather(
+            asyncio.to_thread(odoo_client.get_model_info, model_name),
+            asyncio.to_thread(
+                odoo_client.get_model_fields, model_name, MODEL_FIELD_ATTRIBUTES
+            ),
+        )
+        if "error" in model_info:
+            return _dumps(model_info)
 
-        # Get field definitions
-        fields = odoo_client.get_model_fields(model_name)
         model_info["fields"] = fields
 
-        return json.dumps(model_info, indent=2)
+        rendered = _dumps(model_info)
+        odoo_client.metadata_cache.set(key, rendered, ttl=RESOURCE_TTL)
+        return rendered
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.resource(
     "odoo://record/{model_name}/{record_id}",
     description="Get detailed information of a specific record by ID",
 )
-def get_record(model_name: str, record_id: str) -> str:
+async def get_record(model_name: str, record_id: str) -> str:
     """
     Get a specific record by ID
 
@@ -109,24 +256,57 @@ def get_record(model_name: str, record_id: str) -> str:
         model_name: Name of the Odoo model (e.g., 'res.partner')
         record_id: ID of the record
     """
-    odoo_client = get_odoo_client()
+    return await _record_resource(model_name, record_id)
+
+
+@mcp.resource(
+    "odoo://record/{model_name}/{record_id}/{fields}",
+    description="Get selected fields (comma-separated) of a specific record by ID",
+)
+async def get_record_fields(model_name: str, record_id: str, fields: str) -> str:
+    """
+    Get a specific record by ID, reading only the given fields
+
+    Parameters:
+        model_name: Name of the Odoo model (e.g., 'res.partner')
+        record_id: ID of the record
+        fields: Comma-separated field names (e.g., 'name,email')
+    """
+    return await _record_resource(model_name, record_id, _split_fields(fields))
+
+
+async def _record_resource(
+    model_name: str, record_id: str, fields: Optional[List[str]] = None
+) -> str:
+    """Read one record; without fields, every non-binary field is read"""
     try:
-        record_id_int = int(record_id)
-        record = odoo_client.read_records(model_name, [record_id_int])
-        if not record:
-            return json.dumps(
-                {"error": f"Record not found: {model_name} ID {record_id}"}, indent=2
-            )
-        return json.dumps(record[0], indent=2)
+        ids = [int(record_id)]
+    except ValueError:
+        return _dumps({"error": f"Invalid record_id: {record_id}"})
+
+    odoo_client = _resource_client()
+    try:
+        if fields is None:
+            fields = await _resource_fields(odoo_client, model_name)
+        # As in _search_resource, Odoo errors (e.g. an unreachable server)
+        # are reported instead of being mistaken for a missing record
+        kwargs = {} if fields is None else {"fields": fields}
+        # The sync client blocks, so keep it off the event loop
+        record = await asyncio.to_thread(
+            odoo_client.execute_method, model_name, "read", ids, **kwargs
+        )
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
+    if not record:
+        return _dumps({"error": f"Record not found: {model_name} ID {record_id}"})
+    return _dumps(record[0])
 
 
 @mcp.resource(
     "odoo://search/{model_name}/{domain}",
     description="Search for records matching the domain",
 )
-def search_records_resource(model_name: str, domain: str) -> str:
+async def search_records_resource(model_name: str, domain: str) -> str:
     """
     Search for records that match a domain
 
@@ -134,20 +314,55 @@ def search_records_resource(model_name: str, domain: str) -> str:
         model_name: Name of the Odoo model (e.g., 'res.partner')
         domain: Search domain in JSON format (e.g., '[["name", "ilike", "test"]]')
     """
-    odoo_client = get_odoo_client()
+    return await _search_resource(model_name, domain)
+
+
+@mcp.resource(
+    "odoo://search/{model_name}/{domain}/{fields}",
+    description="Search for records matching the domain, reading only the given fields (comma-separated)",
+)
+async def search_records_fields_resource(
+    model_name: str, domain: str, fields: str
+) -> str:
+    """
+    Search for records that match a domain, reading only the given fields
+
+    Parameters:
+        model_name: Name of the Odoo model (e.g., 'res.partner')
+        domain: Search domain in JSON format (e.g., '[["name", "ilike", "test"]]')
+        fields: Comma-separated field names (e.g., 'name,email')
+    """
+    return await _search_resource(model_name, domain, _split_fields(fields))
+
+
+async def _search_resource(
+    model_name: str, domain: str, fields: Optional[List[str]] = None
+) -> str:
+    """Search records; without fields, every non-binary field is read"""
+    odoo_client = _resource_client()
     try:
+        if fields is None:
+            fields = await _resource_fields(odoo_client, model_name)
+
         # Parse domain from JSON string
-        domain_list = json.loads(domain)
+        domain_list = _loads(domain)
 
         # Set a reasonable default limit
         limit = 10
 
-        # Perform search_read for efficiency
-        results = odoo_client.search_read(model_name, domain_list, limit=limit)
-
-        return json.dumps(results, indent=2)
+        # Unlike search_read(), execute_method() raises Odoo errors, so
+        # they are reported by the handler below
+        results = await asyncio.to_thread(
+            odoo_client.execute_method,
+            model_name,
+            "search_read",
+            domain_list,
+            fields=fields,
+            limit=limit,
+        )
+        return _dumps(results)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 # ----- Pydantic models for type safety -----
@@ -187,6 +402,10 @@ class EmployeeSearchResult(BaseModel):
     name: str = Field(description="Employee name")
 
 
+# Validates a whole result list in one call instead of one model at a time
+EMPLOYEE_RESULTS = TypeAdapter(List[EmployeeSearchResult])
+
+
 class CalendarSearchResult(BaseModel):
     """Represents a single calendar search result."""
 
@@ -232,6 +451,38 @@ class Holiday(BaseModel):
     state: str = Field(description="State of the holiday")
 
 
+# Fields of hr.leave.report.calendar read by search_holidays
+HOLIDAY_FIELDS = list(Holiday.model_fields)
+
+# Validates a whole result list in one call instead of one model at a time
+HOLIDAY_RESULTS = TypeAdapter(List[Holiday])
+
+# Fields read by the calendar and partner tools
+CALENDAR_EVENT_FIELDS = [
+    "name",
+    "start",
+    "stop",
+    "allday",
+    "location",
+    "description",
+    "partner_ids",
+    "opportunity_id",
+    "res_model",
+    "res_id",
+]
+LEAD_FIELDS = ["name", "contact_name", "partner_name", "partner_id", "user_id"]
+ACTIVITY_TYPE_FIELDS = ["id", "name"]
+# Candidate "todo" activity types, "代办" is preferred over the others
+ACTIVITY_TYPE_DOMAIN = [
+    "|",
+    "|",
+    ["name", "ilike", "代办"],
+    ["name", "ilike", "todo"],
+    ["name", "ilike", "to do"],
+]
+PARTNER_FIELDS = ["name", "comment"]
+
+
 class SearchHolidaysResponse(BaseModel):
     """Response model for the search_holidays tool."""
 
@@ -245,8 +496,139 @@ class SearchHolidaysResponse(BaseModel):
 # ----- MCP Tools -----
 
 
+# ----- Domain normalization -----
+
+# Logical operators allowed between domain conditions
+DOMAIN_OPERATORS = ("&", "|", "!")
+
+# execute_method normalizes the domain (first argument) of these methods
+SEARCH_METHODS = frozenset({"search", "search_count", "search_read"})
+
+
+def _valid_domain(domain) -> list:
+    """Keep only operators and [field, operator, value] conditions"""
+    return [
+        cond
+        for cond in domain
+        if cond in DOMAIN_OPERATORS
+        or (
+            isinstance(cond, list)
+            and len(cond) == 3
+            and isinstance(cond[0], str)
+            and isinstance(cond[1], str)
+        )
+    ]
+
+
+def _domain_from_dict(domain: dict) -> list:
+    """Convert {"conditions": [{"field", "operator", "value"}, ...]}"""
+    return _valid_domain(
+        [cond["field"], cond["operator"], cond["value"]]
+        for cond in domain.get("conditions", [])
+        if isinstance(cond, dict)
+        and all(k in cond for k in ["field", "operator", "value"])
+    )
+
+
+def _domain_from_list(domain: list) -> list:
+    """Accept a list of conditions, or a single [field, operator, value]"""
+    if not domain:
+        return []
+
+    # One pass: a list of conditions if every item is a list or any item is
+    # a logical operator
+    is_condition_list = True
+    for item in domain:
+        if isinstance(item, list):
+            continue
+        if item in DOMAIN_OPERATORS:
+            is_condition_list = True
+            break
+        is_condition_list = False
+    if is_condition_list:
+        return _valid_domain(domain)
+    if len(domain) >= 3 and isinstance(domain[0], str):
+        # Case [field, operator, value] (not [[field, operator, value]])
+        return _valid_domain([domain])
+    return []
+
+
+def _parse_domain_str(domain: str):
+    """
+    Parse a domain string as JSON or as a Python literal
+
+    Odoo-style strings ("[('name', 'ilike', 'x')]") are tried with
+    ast.literal_eval first, everything else with JSON first; if the first
+    parser fails the other one is tried. Returns None if both fail.
+    """
+    stripped = domain.lstrip()
+    if stripped.startswith("[") and ("'" in stripped or "(" in stripped):
+        parsers = (ast.literal_eval, _loads)
+    else:
+        parsers = (_loads, ast.literal_eval)
+    for parse in parsers:
+        try:
+            return parse(domain)
+        except Exception:
+            pass
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _domain_from_str(domain: str) -> list:
+    """
+    Parse a JSON or Python literal domain string
+
+    Results are cached, so callers must not modify the returned list.
+    """
+    parsed_domain = _parse_domain_str(domain)
+    if isinstance(parsed_domain, dict) and "conditions" in parsed_domain:
+        return _domain_from_dict(parsed_domain)
+    if isinstance(parsed_domain, list):
+        # Python literals write conditions as tuples
+        return _valid_domain(
+            [list(cond) if isinstance(cond, tuple) else cond for cond in parsed_domain]
+        )
+    return []
+
+
+_DOMAIN_PARSERS = {
+    type(None): lambda domain: [],
+    dict: _domain_from_dict,
+    list: _domain_from_list,
+    str: _domain_from_str,
+}
+
+
+def _normalize_domain(domain) -> list:
+    """
+    Normalize a search domain passed to execute_method into Odoo's list format
+
+    Accepts a list of conditions, a single condition, a {"conditions": [...]}
+    object, or either of those as a JSON / Python literal string. Anything
+    that is not a valid condition or logical operator is dropped.
+    """
+    # Fast path: a list of well-formed conditions is already what Odoo expects
+    if isinstance(domain, list) and all(
+        isinstance(cond, list)
+        and len(cond) == 3
+        and isinstance(cond[0], str)
+        and isinstance(cond[1], str)
+        for cond in domain
+    ):
+        return domain
+
+    # Check if domain is wrapped unnecessarily ([domain] instead of domain)
+    if isinstance(domain, list) and len(domain) == 1 and isinstance(domain[0], list):
+        # Case [[domain]] - unwrap to [domain]
+        domain = domain[0]
+
+    parser = _DOMAIN_PARSERS.get(type(domain))
+    return parser(domain) if parser else []
+
+
 @mcp.tool(description="Execute a custom method on an Odoo model")
-def execute_method(
+async def execute_method(
     ctx: Context,
     model: str,
     method: str,
@@ -268,14 +650,13 @@ def execute_method(
         - result: Result of the method (if success)
         - error: Error message (if failure)
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
     try:
         args = args or []
         kwargs = kwargs or {}
 
         # Special handling for search methods like search, search_count, search_read
-        search_methods = ["search", "search_count", "search_read"]
-        if method in search_methods and args:
+        if method in SEARCH_METHODS and args:
             # Search methods usually have domain as the first parameter
             # args: [[domain], limit, offset, ...] or [domain, limit, offset, ...]
             normalized_args = list(
@@ -284,108 +665,31 @@ def execute_method(
 
             if len(normalized_args) > 0:
                 # Process domain in args[0]
-                domain = normalized_args[0]
-                domain_list = []
-
-                # Check if domain is wrapped unnecessarily ([domain] instead of domain)
-                if (
-                    isinstance(domain, list)
-                    and len(domain) == 1
-                    and isinstance(domain[0], list)
-                ):
-                    # Case [[domain]] - unwrap to [domain]
-                    domain = domain[0]
-
-                # Normalize domain similar to search_records function
-                if domain is None:
-                    domain_list = []
-                elif isinstance(domain, dict):
-                    if "conditions" in domain:
-                        # Object format
-                        conditions = domain.get("conditions", [])
-                        domain_list = []
-                        for cond in conditions:
-                            if isinstance(cond, dict) and all(
-                                k in cond for k in ["field", "operator", "value"]
-                            ):
-                                domain_list.append(
-                                    [cond["field"], cond["operator"], cond["value"]]
-                                )
-                elif isinstance(domain, list):
-                    # List format
-                    if not domain:
-                        domain_list = []
-                    elif all(isinstance(item, list) for item in domain) or any(
-                        item in ["&", "|", "!"] for item in domain
-                    ):
-                        domain_list = domain
-                    elif len(domain) >= 3 and isinstance(domain[0], str):
-                        # Case [field, operator, value] (not [[field, operator, value]])
-                        domain_list = [domain]
-                elif isinstance(domain, str):
-                    # String format (JSON)
-                    try:
-                        parsed_domain = json.loads(domain)
-                        if (
-                            isinstance(parsed_domain, dict)
-                            and "conditions" in parsed_domain
-                        ):
-                            conditions = parsed_domain.get("conditions", [])
-                            domain_list = []
-                            for cond in conditions:
-                                if isinstance(cond, dict) and all(
-                                    k in cond for k in ["field", "operator", "value"]
-                                ):
-                                    domain_list.append(
-                                        [cond["field"], cond["operator"], cond["value"]]
-                                    )
-                        elif isinstance(parsed_domain, list):
-                            domain_list = parsed_domain
-                    except json.JSONDecodeError:
-                        try:
-                            import ast
-
-                            parsed_domain = ast.literal_eval(domain)
-                            if isinstance(parsed_domain, list):
-                                domain_list = parsed_domain
-                        except:
-                            domain_list = []
-
-                # Xác thực domain_list
-                if domain_list:
-                    valid_conditions = []
-                    for cond in domain_list:
-                        if isinstance(cond, str) and cond in ["&", "|", "!"]:
-                            valid_conditions.append(cond)
-                            continue
-
-                        if (
-                            isinstance(cond, list)
-                            and len(cond) == 3
-                            and isinstance(cond[0], str)
-                            and isinstance(cond[1], str)
-                        ):
-                            valid_conditions.append(cond)
-
-                    domain_list = valid_conditions
+                domain_list = _normalize_domain(normalized_args[0])
 
                 # Cập nhật args với domain đã chuẩn hóa
                 normalized_args[0] = domain_list
                 args = normalized_args
 
-                # Log for debugging
-                print(f"Executing {method} with normalized domain: {domain_list}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Executing %s with normalized domain: %s", method, domain_list
+                    )
 
-        result = odoo.execute_method(model, method, *args, **kwargs)
+        result = await odoo.execute_method(model, method, *args, **kwargs)
         return {"success": True, "result": result}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-@mcp.tool(name="查询员工", description="Search for employees by name")
-def search_employee(
+@mcp.tool(
+    name="查询员工", description="Search for employees by name", annotations=READ_ONLY
+)
+async def search_employee(
     ctx: Context,
-    name: str = Field(description="The name (or part of the name) to search for."),
+    name: Annotated[
+        str, Field(description="The name (or part of the name) to search for.")
+    ],
     limit: int = 20,
 ) -> SearchEmployeeResponse:
     """
@@ -398,7 +702,7 @@ def search_employee(
     Returns:
         SearchEmployeeResponse containing results or error information.
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
     model = "hr.employee"
     method = "name_search"
 
@@ -406,20 +710,28 @@ def search_employee(
     kwargs = {"name": name, "limit": limit}
 
     try:
-        result = odoo.execute_method(model, method, *args, **kwargs)
-        parsed_result = [
-            EmployeeSearchResult(id=item[0], name=item[1]) for item in result
-        ]
+        result = await odoo.execute_method(model, method, *args, **kwargs)
+        parsed_result = EMPLOYEE_RESULTS.validate_python(
+            [{"id": item[0], "name": item[1]} for item in result]
+        )
         return SearchEmployeeResponse(success=True, result=parsed_result)
     except Exception as e:
         return SearchEmployeeResponse(success=False, error=str(e))
 
-@mcp.tool(name="查询日历", description="根据日期范围查询当前用户的日历，返回详细时间信息")
-def search_calendar_by_date_range(
+
+@mcp.tool(
+    name="查询日历",
+    description="根据日期范围查询当前用户的日历，返回详细时间信息",
+    annotations=READ_ONLY,
+)
+async def search_calendar_by_date_range(
     ctx: Context,
-    start_date: str = Field(description="开始日期，格式为 YYYY-MM-DD"),
-    end_date: Optional[str] = Field(default=None, description="结束日期，格式为 YYYY-MM-DD（可选，默认为开始日期）"),
-    limit: int = Field(default=50, description="返回的最大结果数（默认50）"),
+    start_date: Annotated[str, Field(description="开始日期，格式为 YYYY-MM-DD")],
+    end_date: Annotated[
+        Optional[str],
+        Field(description="结束日期，格式为 YYYY-MM-DD（可选，默认为开始日期）"),
+    ] = None,
+    limit: Annotated[int, Field(description="返回的最大结果数（默认50）")] = 50,
 ) -> SearchCalendarResponse:
     """
     Search for current user's calendar events within a date range with detailed time information.
@@ -432,7 +744,7 @@ def search_calendar_by_date_range(
     Returns:
         SearchCalendarResponse containing detailed calendar events with time information.
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
     model = "calendar.event"
     method = "search_read"
 
@@ -442,16 +754,19 @@ def search_calendar_by_date_range(
 
     # 验证日期格式
     try:
-        from datetime import datetime
-        datetime.strptime(start_date, "%Y-%m-%d")
-        datetime.strptime(end_date, "%Y-%m-%d")
+        parse_date(start_date)
+        if end_date != start_date:
+            parse_date(end_date)
     except ValueError:
         return SearchCalendarResponse(success=False, error="日期格式错误，应为 YYYY-MM-DD")
 
     # 获取当前用户的partner_id
     current_partner_id = None
     try:
-        current_user = odoo.execute_method("res.users", "read", [odoo.uid], ["partner_id"])
+        uid = await odoo.authenticate()
+        current_user = await odoo.execute_method(
+            "res.users", "read", [uid], ["partner_id"]
+        )
         if current_user and current_user[0].get("partner_id"):
             current_partner_id = current_user[0]["partner_id"]
             if isinstance(current_partner_id, list):
@@ -467,33 +782,34 @@ def search_calendar_by_date_range(
     ]
 
     kwargs = {
-        'fields': [
-            'name', 'start', 'stop', 'allday', 'location', 'description',
-            'partner_ids', 'opportunity_id', 'res_model', 'res_id'
-        ],
-        'limit': limit,
-        'order': 'start ASC'  # 按开始时间排序
+        "fields": CALENDAR_EVENT_FIELDS,
+        "limit": limit,
+        "order": "start ASC",  # 按开始时间排序
     }
 
     try:
         # 修复参数传递方式，直接传递domain和kwargs
-        result = odoo.execute_method(model, method, domain, **kwargs)
+        result = await odoo.execute_method(model, method, domain, **kwargs)
+
+        # 并行读取每个事件的参与者
+        async def read_partners(partner_ids):
+            if not partner_ids:
+                return []
+            return await odoo.execute_method(
+                "res.partner", "read", partner_ids, ["name"]
+            )
+
+        partner_results = await asyncio.gather(
+            *(read_partners(item.get("partner_ids")) for item in result),
+            return_exceptions=True,
+        )
 
         parsed_result = []
-        for item in result:
+        for item, partner_result in zip(result, partner_results):
             # 获取参与者名称
             partner_names = []
-            if item.get("partner_ids"):
-                try:
-                    partner_result = odoo.execute_method(
-                        "res.partner",
-                        "read",
-                        item["partner_ids"],
-                        ["name"]
-                    )
-                    partner_names = [p["name"] for p in partner_result if p.get("name")]
-                except Exception:
-                    partner_names = []
+            if not isinstance(partner_result, Exception):
+                partner_names = [p["name"] for p in partner_result if p.get("name")]
 
             # 处理商机ID
             opportunity_id = None
@@ -521,19 +837,8 @@ def search_calendar_by_date_range(
     except Exception as e:
         return SearchCalendarResponse(success=False, error=str(e))
 
-def search_partner_by_name(name: str, limit: int = 10):
-    models = endpoint_object()
-    uid = get_uid()
-    # Search and read
-    search_and_read = models.execute_kw(db, uid, password,
-                                        'res.partner', 'search_read',
-                                        [["&",["is_company","=",True],
-                                          ["name","ilike", name],]],
-                                        {'fields': ['name', 'email','mobile','opportunity_count' ,'meeting_count','comment'], 'limit': limit})
-    return search_and_read
-
-@mcp.tool(description="Search for holidays within a date range")
-def search_holidays(
+@mcp.tool(description="Search for holidays within a date range", annotations=READ_ONLY)
+async def search_holidays(
     ctx: Context,
     start_date: str,
     end_date: str,
@@ -550,26 +855,25 @@ def search_holidays(
     Returns:
         SearchHolidaysResponse:  Object containing the search results.
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
 
     # Validate date format using datetime
     try:
-        datetime.strptime(start_date, "%Y-%m-%d")
+        start_date_dt = parse_date(start_date)
     except ValueError:
         return SearchHolidaysResponse(
             success=False, error="Invalid start_date format. Use YYYY-MM-DD."
         )
     try:
-        datetime.strptime(end_date, "%Y-%m-%d")
+        parse_date(end_date)
     except ValueError:
         return SearchHolidaysResponse(
             success=False, error="Invalid end_date format. Use YYYY-MM-DD."
         )
 
     # Calculate adjusted start_date (subtract one day)
-    start_date_dt = datetime.strptime(start_date, "%Y-%m-%d")
     adjusted_start_date_dt = start_date_dt - timedelta(days=1)
-    adjusted_start_date = adjusted_start_date_dt.strftime("%Y-%m-%d")
+    adjusted_start_date = adjusted_start_date_dt.date().isoformat()
 
     # Build the domain
     domain = [
@@ -584,11 +888,12 @@ def search_holidays(
         )
 
     try:
-        holidays = odoo.search_read(
+        holidays = await odoo.search_read(
             model_name="hr.leave.report.calendar",
             domain=domain,
+            fields=HOLIDAY_FIELDS,
         )
-        parsed_holidays = [Holiday(**holiday) for holiday in holidays]
+        parsed_holidays = HOLIDAY_RESULTS.validate_python(holidays)
         return SearchHolidaysResponse(success=True, result=parsed_holidays)
 
     except Exception as e:
@@ -600,6 +905,10 @@ class PartnerSearchResult(BaseModel):
     name: str = Field(description="Partner name")
     comment: Optional[str] = Field(default=None, description="Comment")
 
+
+PARTNER_RESULTS = TypeAdapter(List[PartnerSearchResult])
+
+
 class SearchPartnerResponse(BaseModel):
     """Response model for the search_partner tool."""
     success: bool = Field(description="Indicates if the search was successful")
@@ -608,8 +917,13 @@ class SearchPartnerResponse(BaseModel):
     )
     error: Optional[str] = Field(default=None, description="Error message, if any")
 
-@mcp.tool(name="查询公司伙伴", description="搜索公司类型的伙伴（is_company=True）")
-def search_partner(
+
+@mcp.tool(
+    name="查询公司伙伴",
+    description="搜索公司类型的伙伴（is_company=True）",
+    annotations=READ_ONLY,
+)
+async def search_partner(
     ctx: Context,
     limit: int = 5,
 ) -> SearchPartnerResponse:
@@ -622,22 +936,24 @@ def search_partner(
     Returns:
         SearchPartnerResponse containing results or error information.
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
     model = "res.partner"
     method = "search_read"
     args = [[["is_company", "=", True]]]
-    kwargs = {"fields": ["name", "comment"], "limit": limit}
+    kwargs = {"fields": PARTNER_FIELDS, "limit": limit}
 
     try:
-        result = odoo.execute_method(model, method, *args, **kwargs)
-        parsed_result = [
-            PartnerSearchResult(
-                id=item.get("id"),
-                name=item.get("name"),
-                comment=safe_get_string_field(item, "comment"),
-            )
-            for item in result
-        ]
+        result = await odoo.execute_method(model, method, *args, **kwargs)
+        parsed_result = PARTNER_RESULTS.validate_python(
+            [
+                {
+                    "id": item.get("id"),
+                    "name": item.get("name"),
+                    "comment": safe_get_string_field(item, "comment"),
+                }
+                for item in result
+            ]
+        )
         return SearchPartnerResponse(success=True, result=parsed_result)
     except Exception as e:
         return SearchPartnerResponse(success=False, error=str(e))
@@ -648,17 +964,82 @@ class CreateCalendarResponse(BaseModel):
     id: Optional[int] = Field(default=None, description="Created calendar event ID")
     error: Optional[str] = Field(default=None, description="Error message, if any")
 
+async def get_model_id(odoo_client: AsyncOdooClient, model: str) -> Optional[int]:
+    """
+    Get the ir.model ID of a model
+
+    Model IDs never change while the server runs, so a found ID is cached
+    until the client's metadata cache is cleared. A missing model is looked
+    up again next time, since its module may be installed in the meantime.
+    """
+
+    async def fetch():
+        result = await odoo_client.execute_method(
+            "ir.model", "search_read", [["model", "=", model]], ["id"]
+        )
+        return result[0]["id"] if result else None
+
+    return await _cached_id(odoo_client, ("ir.model.id", model), fetch)
+
+
+async def get_todo_activity_type_id(odoo_client: AsyncOdooClient) -> Optional[int]:
+    """
+    Get the ID of the "todo" mail.activity.type, cached like get_model_id()
+    """
+
+    async def fetch():
+        # 一次查询"代办"、"To Do"等所有候选活动类型
+        activity_types = await odoo_client.execute_method(
+            "mail.activity.type",
+            "search_read",
+            ACTIVITY_TYPE_DOMAIN,
+            ACTIVITY_TYPE_FIELDS,
+        )
+        # 优先使用"代办"类型，如果不存在则使用"To Do"或其他类似的
+        for activity_type in activity_types:
+            if "代办" in (activity_type.get("name") or ""):
+                return activity_type["id"]
+        return activity_types[0]["id"] if activity_types else None
+
+    return await _cached_id(odoo_client, ("mail.activity.type", "todo"), fetch)
+
+
+async def _cached_id(odoo_client: AsyncOdooClient, key: tuple, fetch) -> Optional[int]:
+    """
+    Return the record ID cached under ``key``, awaiting ``fetch()`` on a miss
+
+    Only found IDs are cached; None is fetched again on the next call.
+    """
+    record_id = odoo_client.metadata_cache.get(key)
+    if record_id is None:
+        record_id = await fetch()
+        if record_id is not None:
+            odoo_client.metadata_cache.set(key, record_id, ttl=float("inf"))
+    return record_id
+
+
 @mcp.tool(name="创建日历", description="创建一个新的待办活动，关联到商机并生成日历事件")
-def create_calendar(
+async def create_calendar(
     ctx: Context,
-    date: str = Field(description="活动日期，格式为 YYYY-MM-DD"),
-    name: str = Field(description="待办活动名称"),
-    lead_id: Optional[int] = Field(default=None, description="商机单据ID（关联的商机）"),
-    start_time: Optional[str] = Field(default=None, description="开始时间，格式为 HH:MM（如 09:30）"),
-    end_time: Optional[str] = Field(default=None, description="结束时间，格式为 HH:MM（如 11:00）"),
-    description: Optional[str] = Field(default=None, description="待办事项描述"),
-    location: Optional[str] = Field(default=None, description="活动地点"),
-    activity_type: Optional[str] = Field(default="todo", description="活动类型：todo(代办), meeting(会议), call(电话), email(邮件)"),
+    date: Annotated[str, Field(description="活动日期，格式为 YYYY-MM-DD")],
+    name: Annotated[str, Field(description="待办活动名称")],
+    lead_id: Annotated[
+        Optional[int], Field(description="商机单据ID（关联的商机）")
+    ] = None,
+    start_time: Annotated[
+        Optional[str], Field(description="开始时间，格式为 HH:MM（如 09:30）")
+    ] = None,
+    end_time: Annotated[
+        Optional[str], Field(description="结束时间，格式为 HH:MM（如 11:00）")
+    ] = None,
+    description: Annotated[Optional[str], Field(description="待办事项描述")] = None,
+    location: Annotated[Optional[str], Field(description="活动地点")] = None,
+    activity_type: Annotated[
+        Optional[str],
+        Field(
+            description="活动类型：todo(代办), meeting(会议), call(电话), email(邮件)"
+        ),
+    ] = "todo",
 ) -> CreateCalendarResponse:
     """
     Create a new todo activity linked to opportunity with calendar event.
@@ -676,15 +1057,15 @@ def create_calendar(
     Returns:
         CreateCalendarResponse containing the new activity ID or error information.
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
 
     # 校验日期格式
     try:
-        event_date = datetime.strptime(date, "%Y-%m-%d")
+        event_date = parse_date(date)
     except ValueError:
         return CreateCalendarResponse(success=False, error="日期格式错误，应为 YYYY-MM-DD")
 
-    # 校验时间格式
+    # 校验时间格式（先按本地时间校验，获取用户时区后再附加），无效输入不访问 Odoo
     start_datetime = None
     end_datetime = None
     is_allday = True
@@ -692,27 +1073,17 @@ def create_calendar(
     if start_time or end_time:
         is_allday = False
         try:
-            # 🔧 使用用户设置的时区
-            user_tz = get_user_timezone(odoo)
-            
             if start_time:
-                start_hour, start_minute = map(int, start_time.split(':'))
-                
-                start_datetime =  event_date.replace(
-                      hour=start_hour, 
-                      minute=start_minute,
-                      tzinfo=user_tz
-                  )
+                start_hour, start_minute = map(int, start_time.split(":"))
+                start_datetime = event_date.replace(
+                    hour=start_hour, minute=start_minute
+                )
             else:
-                start_datetime = event_date.replace(hour=9, minute=0, tzinfo=user_tz)
+                start_datetime = event_date.replace(hour=9, minute=0)
 
             if end_time:
                 end_hour, end_minute = map(int, end_time.split(':'))
-                end_datetime = event_date.replace(
-                      hour=end_hour, 
-                      minute=end_minute,
-                      tzinfo=user_tz
-                  )
+                end_datetime = event_date.replace(hour=end_hour, minute=end_minute)
             else:
                 # 如果只有开始时间，默认持续1小时
                 end_datetime = start_datetime + timedelta(hours=1)
@@ -724,16 +1095,44 @@ def create_calendar(
         if end_datetime <= start_datetime:
             return CreateCalendarResponse(success=False, error="结束时间必须晚于开始时间")
 
-    # 如果提供了商机ID，先获取商机信息
-    lead_info = None
+    # 并行获取当前用户（partner_id 和时区）、商机信息、活动类型和模型ID（互不依赖）
+    try:
+        uid = await odoo.authenticate()
+    except Exception as e:
+        return CreateCalendarResponse(success=False, error=str(e))
+    lookups = [
+        odoo.execute_method("res.users", "read", [uid], ["partner_id", "tz"]),
+        # 活动类型和模型ID来自元数据缓存，通常无需访问 Odoo
+        get_todo_activity_type_id(odoo),
+    ]
     if lead_id:
-        try:
-            lead_result = odoo.execute_method(
+        lookups.append(get_model_id(odoo, "crm.lead"))
+        lookups.append(
+            odoo.execute_method(
                 "crm.lead",
                 "read",
                 [lead_id],
-                ["name", "contact_name", "partner_name", "partner_id", "user_id"]
+                LEAD_FIELDS,
             )
+        )
+    current_user, activity_type_id, *lead_results = await asyncio.gather(
+        *lookups, return_exceptions=True
+    )
+
+    if not is_allday:
+        # 🔧 使用用户设置的时区
+        user_tz = _user_timezone(current_user)
+        start_datetime = start_datetime.replace(tzinfo=user_tz)
+        end_datetime = end_datetime.replace(tzinfo=user_tz)
+
+    # 如果提供了商机ID，先获取商机信息
+    lead_info = None
+    res_model_id = None
+    if lead_id:
+        res_model_id, lead_result = lead_results
+        try:
+            if isinstance(lead_result, Exception):
+                raise lead_result
             if lead_result:
                 lead_info = lead_result[0]
             else:
@@ -742,49 +1141,17 @@ def create_calendar(
             return CreateCalendarResponse(success=False, error=f"获取商机信息失败: {str(e)}")
 
     # 首先获取或创建活动类型
-    activity_type_id = None
-    try:
-        # 查找"代办"活动类型，如果不存在则使用默认的
-        activity_types = odoo.execute_method(
-            "mail.activity.type",
-            "search_read",
-            [["name", "ilike", "代办"]],
-            ["id", "name"]
-        )
-        if activity_types:
-            activity_type_id = activity_types[0]["id"]
-        else:
-            # 如果没有找到"代办"类型，查找"To Do"或其他类似的
-            activity_types = odoo.execute_method(
-                "mail.activity.type",
-                "search_read",
-                ["|", ["name", "ilike", "todo"], ["name", "ilike", "to do"]],
-                ["id", "name"]
-            )
-            if activity_types:
-                activity_type_id = activity_types[0]["id"]
-    except Exception:
+    if isinstance(activity_type_id, Exception):
         # 如果获取活动类型失败，继续使用默认值
-        pass
+        activity_type_id = None
 
     # 创建活动（mail.activity）
     activity_model = "mail.activity"
     activity_method = "create"
 
     # 获取模型ID（mail.activity需要res_model_id而不是res_model字符串）
-    res_model_id = None
-    if lead_id:
-        try:
-            model_result = odoo.execute_method(
-                "ir.model",
-                "search_read",
-                [["model", "=", "crm.lead"]],
-                ["id"]
-            )
-            if model_result:
-                res_model_id = model_result[0]["id"]
-        except Exception:
-            return CreateCalendarResponse(success=False, error="获取模型ID失败")
+    if isinstance(res_model_id, Exception):
+        return CreateCalendarResponse(success=False, error="获取模型ID失败")
 
     # 构建活动数据（mail.activity）
     activity_data = {
@@ -809,16 +1176,7 @@ def create_calendar(
             user_id = user_id[0]
         activity_data["user_id"] = user_id
     else:
-        activity_data["user_id"] = odoo.uid
-    activity_id = None    
-    if res_model_id:
-    # 创建活动
-        try:
-            activity_id = odoo.execute_method(activity_model, activity_method, [activity_data])
-            if isinstance(activity_id, list) and len(activity_id) > 0:
-                activity_id = activity_id[0]
-        except Exception as e:
-            return CreateCalendarResponse(success=False, error=f"创建活动失败: {str(e)}")
+        activity_data["user_id"] = uid
 
     # 创建对应的日历事件（确保在日历中显示）
     calendar_event_id = None
@@ -840,8 +1198,9 @@ def create_calendar(
     # 获取当前用户信息并添加为参与者
     participant_ids = []
     try:
-        # 获取当前用户的partner_id
-        current_user = odoo.execute_method("res.users", "read", [odoo.uid], ["partner_id"])
+        # 当前用户的partner_id（已在上面获取）
+        if isinstance(current_user, Exception):
+            raise current_user
         if current_user and current_user[0].get("partner_id"):
             current_partner_id = current_user[0]["partner_id"]
             if isinstance(current_partner_id, list):
@@ -860,19 +1219,9 @@ def create_calendar(
         # 设置商机关联字段（用于日历中的跳转）
         event_data["opportunity_id"] = lead_id
 
-        # 获取商机的模型ID（用于更准确的关联）
-        try:
-            lead_model_result = odoo.execute_method(
-                "ir.model",
-                "search_read",
-                [["model", "=", "crm.lead"]],
-                ["id"]
-            )
-            if lead_model_result:
-                event_data["res_model_id"] = lead_model_result[0]["id"]
-        except Exception:
-            # 如果获取失败，继续使用字符串形式
-            pass
+        # 获取商机的模型ID（用于更准确的关联，已在上面获取）
+        if res_model_id:
+            event_data["res_model_id"] = res_model_id
 
         # 如果商机有关联的客户，添加为参与者
         if lead_info.get("partner_id"):
@@ -912,14 +1261,39 @@ def create_calendar(
     if location and location.strip():
         event_data["location"] = location.strip()
 
-    # 创建日历事件（确保在日历中显示）
-    try:
-        calendar_event_id = odoo.execute_method("calendar.event", "create", [event_data])
-        if isinstance(calendar_event_id, list) and len(calendar_event_id) > 0:
-            calendar_event_id = calendar_event_id[0]
-    except Exception as e:
+    # 同时创建活动和日历事件：两者互不依赖，并行发送节省一次往返
+    creates = [odoo.execute_method("calendar.event", "create", [event_data])]
+    if res_model_id:
+        creates.append(
+            odoo.execute_method(activity_model, activity_method, [activity_data])
+        )
+    calendar_event_id, *activity_results = await asyncio.gather(
+        *creates, return_exceptions=True
+    )
+
+    if isinstance(calendar_event_id, Exception):
         # 即使日历事件创建失败，活动已经创建成功
-        pass
+        calendar_event_id = None
+    elif isinstance(calendar_event_id, list) and len(calendar_event_id) > 0:
+        calendar_event_id = calendar_event_id[0]
+
+    activity_id = None
+    if activity_results:
+        activity_id = activity_results[0]
+        if isinstance(activity_id, Exception):
+            # 活动创建失败时删除已创建的日历事件，避免留下孤立记录
+            if calendar_event_id:
+                try:
+                    await odoo.execute_method(
+                        "calendar.event", "unlink", [calendar_event_id]
+                    )
+                except Exception:
+                    pass
+            return CreateCalendarResponse(
+                success=False, error=f"创建活动失败: {str(activity_id)}"
+            )
+        if isinstance(activity_id, list) and len(activity_id) > 0:
+            activity_id = activity_id[0]
 
     # 返回活动ID（主要的创建结果）
     # 注意：这里返回的是活动ID，但同时也创建了日历事件用于在日历中显示
@@ -933,11 +1307,21 @@ class SearchPartnerByNameResponse(BaseModel):
     )
     error: Optional[str] = Field(default=None, description="Error message, if any")
 
-@mcp.tool(name="按名称查询公司伙伴", description="根据名称模糊搜索公司类型的伙伴（is_company=True）")
-def search_partner_by_name(
+
+@mcp.tool(
+    name="按名称查询公司伙伴",
+    description="根据名称模糊搜索公司类型的伙伴（is_company=True）",
+    annotations=READ_ONLY,
+)
+async def search_partner_by_name(
     ctx: Context,
-    name: str = Field(description="要搜索的伙伴名称或部分名称"),
-    limit: int = Field(default=10, description="返回的最大结果数。如果大于等于1，则限制返回指定数量的记录；小于1则查询全部记录"),
+    name: Annotated[str, Field(description="要搜索的伙伴名称或部分名称")],
+    limit: Annotated[
+        int,
+        Field(
+            description="返回的最大结果数。如果大于等于1，则限制返回指定数量的记录；小于1则查询全部记录"
+        ),
+    ] = 10,
 ) -> SearchPartnerByNameResponse:
     """
     Search for company partners by name (is_company=True, name ilike).
@@ -949,7 +1333,7 @@ def search_partner_by_name(
     Returns:
         SearchPartnerByNameResponse containing results or error information.
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
     model = "res.partner"
     method = "search_read"
     args = [[
@@ -959,20 +1343,22 @@ def search_partner_by_name(
     ]]
 
     # 如果 limit 大于等于 1，则设置 limit；否则查询全部（不设置 limit）
-    kwargs = {"fields": ["name", "comment"]}
+    kwargs = {"fields": PARTNER_FIELDS}
     if limit >= 1:
         kwargs["limit"] = limit
 
     try:
-        result = odoo.execute_method(model, method, *args, **kwargs)
-        parsed_result = [
-            PartnerSearchResult(
-                id=item.get("id"),
-                name=item.get("name"),
-                comment=safe_get_string_field(item, "comment"),
-            )
-            for item in result
-        ]
+        result = await odoo.execute_method(model, method, *args, **kwargs)
+        parsed_result = PARTNER_RESULTS.validate_python(
+            [
+                {
+                    "id": item.get("id"),
+                    "name": item.get("name"),
+                    "comment": safe_get_string_field(item, "comment"),
+                }
+                for item in result
+            ]
+        )
         return SearchPartnerByNameResponse(success=True, result=parsed_result)
     except Exception as e:
         return SearchPartnerByNameResponse(success=False, error=str(e))
@@ -984,17 +1370,19 @@ class CreateCustomerResponse(BaseModel):
     error: Optional[str] = Field(default=None, description="Error message, if any")
 
 @mcp.tool(name="创建客户", description="创建一个新的客户（个人或公司）")
-def create_customer(
+async def create_customer(
     ctx: Context,
-    name: str = Field(description="客户名称"),
-    is_company: bool = Field(default=True, description="是否为公司（True=公司，False=个人）"),
-    email: Optional[str] = Field(default=None, description="邮箱地址"),
-    phone: Optional[str] = Field(default=None, description="电话号码"),
-    mobile: Optional[str] = Field(default=None, description="手机号码"),
-    street: Optional[str] = Field(default=None, description="街道地址"),
-    city: Optional[str] = Field(default=None, description="城市"),
-    country_id: Optional[int] = Field(default=None, description="国家ID（可选）"),
-    comment: Optional[str] = Field(default=None, description="备注信息"),
+    name: Annotated[str, Field(description="客户名称")],
+    is_company: Annotated[
+        bool, Field(description="是否为公司（True=公司，False=个人）")
+    ] = True,
+    email: Annotated[Optional[str], Field(description="邮箱地址")] = None,
+    phone: Annotated[Optional[str], Field(description="电话号码")] = None,
+    mobile: Annotated[Optional[str], Field(description="手机号码")] = None,
+    street: Annotated[Optional[str], Field(description="街道地址")] = None,
+    city: Annotated[Optional[str], Field(description="城市")] = None,
+    country_id: Annotated[Optional[int], Field(description="国家ID（可选）")] = None,
+    comment: Annotated[Optional[str], Field(description="备注信息")] = None,
 ) -> CreateCustomerResponse:
     """
     Create a new customer (individual or company).
@@ -1013,7 +1401,7 @@ def create_customer(
     Returns:
         CreateCustomerResponse containing the new customer ID or error information.
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
 
     # 校验必填字段
     if not name or name.strip() == "":
@@ -1021,9 +1409,7 @@ def create_customer(
 
     # 校验邮箱格式（如果提供）
     if email and email.strip():
-        import re
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email.strip()):
+        if not EMAIL_RE.match(email.strip()):
             return CreateCustomerResponse(success=False, error="邮箱格式不正确")
 
     model = "res.partner"
@@ -1038,25 +1424,24 @@ def create_customer(
     }
 
     # 添加可选字段
-    if email and email.strip():
-        customer_data["email"] = email.strip()
-    if phone and phone.strip():
-        customer_data["phone"] = phone.strip()
-    if mobile and mobile.strip():
-        customer_data["mobile"] = mobile.strip()
-    if street and street.strip():
-        customer_data["street"] = street.strip()
-    if city and city.strip():
-        customer_data["city"] = city.strip()
+    set_stripped_fields(
+        customer_data,
+        (
+            ("email", email),
+            ("phone", phone),
+            ("mobile", mobile),
+            ("street", street),
+            ("city", city),
+            ("comment", comment),
+        ),
+    )
     if country_id:
         customer_data["country_id"] = country_id
-    if comment and comment.strip():
-        customer_data["comment"] = comment.strip()
 
     args = [customer_data]
 
     try:
-        customer_id = odoo.execute_method(model, method, args)
+        customer_id = await odoo.execute_method(model, method, args)
         # Odoo's create method returns a list of IDs, we need the first one
         if isinstance(customer_id, list) and len(customer_id) > 0:
             customer_id = customer_id[0]
@@ -1071,22 +1456,26 @@ class CreateLeadResponse(BaseModel):
     error: Optional[str] = Field(default=None, description="Error message, if any")
 
 @mcp.tool(name="创建线索", description="创建一个新的销售商机，可以基于现有客户或手动输入信息")
-def create_lead(
+async def create_lead(
     ctx: Context,
-    name: str = Field(description="商机名称/机会名称"),
-    partner_id: Optional[int] = Field(default=None, description="客户ID（如果基于现有客户创建）"),
-    contact_name: Optional[str] = Field(default=None, description="联系人姓名"),
-    email_from: Optional[str] = Field(default=None, description="邮箱地址"),
-    phone: Optional[str] = Field(default=None, description="电话号码"),
-    mobile: Optional[str] = Field(default=None, description="手机号码"),
-    company_name: Optional[str] = Field(default=None, description="公司名称"),
-    street: Optional[str] = Field(default=None, description="街道地址"),
-    city: Optional[str] = Field(default=None, description="城市"),
-    country_id: Optional[int] = Field(default=None, description="国家ID（可选）"),
-    expected_revenue: Optional[float] = Field(default=None, description="预期收入"),
-    probability: Optional[float] = Field(default=10.0, description="成功概率（0-100，默认10）"),
-    description: Optional[str] = Field(default=None, description="商机描述"),
-    source_id: Optional[int] = Field(default=None, description="来源ID（可选）"),
+    name: Annotated[str, Field(description="商机名称/机会名称")],
+    partner_id: Annotated[
+        Optional[int], Field(description="客户ID（如果基于现有客户创建）")
+    ] = None,
+    contact_name: Annotated[Optional[str], Field(description="联系人姓名")] = None,
+    email_from: Annotated[Optional[str], Field(description="邮箱地址")] = None,
+    phone: Annotated[Optional[str], Field(description="电话号码")] = None,
+    mobile: Annotated[Optional[str], Field(description="手机号码")] = None,
+    company_name: Annotated[Optional[str], Field(description="公司名称")] = None,
+    street: Annotated[Optional[str], Field(description="街道地址")] = None,
+    city: Annotated[Optional[str], Field(description="城市")] = None,
+    country_id: Annotated[Optional[int], Field(description="国家ID（可选）")] = None,
+    expected_revenue: Annotated[Optional[float], Field(description="预期收入")] = None,
+    probability: Annotated[
+        Optional[float], Field(description="成功概率（0-100，默认10）")
+    ] = 10.0,
+    description: Annotated[Optional[str], Field(description="商机描述")] = None,
+    source_id: Annotated[Optional[int], Field(description="来源ID（可选）")] = None,
 ) -> CreateLeadResponse:
     """
     Create a new sales opportunity, either based on existing customer or with manual input.
@@ -1110,7 +1499,7 @@ def create_lead(
     Returns:
         CreateLeadResponse containing the new opportunity ID or error information.
     """
-    odoo = ctx.request_context.lifespan_context.odoo
+    odoo = _get_odoo_async(ctx)
 
     # 校验必填字段
     if not name or name.strip() == "":
@@ -1118,9 +1507,7 @@ def create_lead(
 
     # 校验邮箱格式（如果提供）
     if email_from and email_from.strip():
-        import re
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email_from.strip()):
+        if not EMAIL_RE.match(email_from.strip()):
             return CreateLeadResponse(success=False, error="邮箱格式不正确")
 
     # 校验概率范围
@@ -1131,11 +1518,23 @@ def create_lead(
     if expected_revenue is not None and expected_revenue < 0:
         return CreateLeadResponse(success=False, error="预期收入不能为负数")
 
-    # 如果提供了客户ID，先获取客户信息
+    # 如果提供了客户ID，先获取客户信息（所有客户相关字段都手动提供时无需读取）
     partner_info = None
-    if partner_id:
+    need_partner_read = partner_id and not all(
+        (
+            contact_name,
+            email_from,
+            phone,
+            mobile,
+            street,
+            city,
+            country_id,
+            company_name,
+        )
+    )
+    if need_partner_read:
         try:
-            partner_result = odoo.execute_method(
+            partner_result = await odoo.execute_method(
                 "res.partner",
                 "read",
                 [partner_id],
@@ -1144,9 +1543,13 @@ def create_lead(
             if partner_result:
                 partner_info = partner_result[0]
             else:
-                return CreateLeadResponse(success=False, error=f"找不到ID为{partner_id}的客户")
+                return CreateLeadResponse(
+                    success=False, error=f"找不到ID为{partner_id}的客户"
+                )
         except Exception as e:
-            return CreateLeadResponse(success=False, error=f"获取客户信息失败: {str(e)}")
+            return CreateLeadResponse(
+                success=False, error=f"获取客户信息失败: {str(e)}"
+            )
 
     model = "crm.lead"
     method = "create"
@@ -1157,9 +1560,11 @@ def create_lead(
         "type": "opportunity",  # 直接标记为商机类型
     }
 
+    if partner_id:
+        lead_data["partner_id"] = partner_id
+
     # 如果基于现有客户创建，使用客户信息
     if partner_info:
-        lead_data["partner_id"] = partner_id
         # 使用客户信息作为默认值，但允许手动输入的参数覆盖
         if not contact_name and partner_info.get("name"):
             lead_data["contact_name"] = partner_info["name"]
@@ -1184,62 +1589,66 @@ def create_lead(
             lead_data["partner_name"] = partner_info["name"]
 
     # 添加手动输入的字段（这些会覆盖从客户信息获取的默认值）
-    if contact_name and contact_name.strip():
-        lead_data["contact_name"] = contact_name.strip()
-    if email_from and email_from.strip():
-        lead_data["email_from"] = email_from.strip()
-    if phone and phone.strip():
-        lead_data["phone"] = phone.strip()
-    if mobile and mobile.strip():
-        lead_data["mobile"] = mobile.strip()
-    if company_name and company_name.strip():
-        lead_data["partner_name"] = company_name.strip()
-    if street and street.strip():
-        lead_data["street"] = street.strip()
-    if city and city.strip():
-        lead_data["city"] = city.strip()
+    set_stripped_fields(
+        lead_data,
+        (
+            ("contact_name", contact_name),
+            ("email_from", email_from),
+            ("phone", phone),
+            ("mobile", mobile),
+            ("partner_name", company_name),
+            ("street", street),
+            ("city", city),
+            ("description", description),
+        ),
+    )
     if country_id:
         lead_data["country_id"] = country_id
     if expected_revenue is not None:
         lead_data["expected_revenue"] = expected_revenue
     if probability is not None:
         lead_data["probability"] = probability
-    if description and description.strip():
-        lead_data["description"] = description.strip()
     if source_id:
         lead_data["source_id"] = source_id
 
     args = [lead_data]
 
     try:
-        lead_id = odoo.execute_method(model, method, args)
+        lead_id = await odoo.execute_method(model, method, args)
         # Odoo's create method returns a list of IDs, we need the first one
         if isinstance(lead_id, list) and len(lead_id) > 0:
             lead_id = lead_id[0]
         return CreateLeadResponse(success=True, id=lead_id)
     except Exception as e:
         return CreateLeadResponse(success=False, error=str(e))
-@mcp.tool(name="get-current-date", description="获取当前日期，以用户设置的时区为准，返回格式为 \"yyyy-MM-dd HH:mm:ss\"，为其他需要日期的接口提供准确的日期输入。")
-def get_current_date(ctx: Context) -> str:
+
+
+@mcp.tool(
+    name="get-current-date",
+    description='获取当前日期，以用户设置的时区为准，返回格式为 "yyyy-MM-dd HH:mm:ss"，为其他需要日期的接口提供准确的日期输入。',
+    annotations=READ_ONLY,
+)
+async def get_current_date(ctx: Context) -> str:
     """
     获取当前日期，以用户在 Odoo 中设置的时区为准，返回格式为 "yyyy-MM-dd HH:mm:ss"
     """
-    odoo = ctx.request_context.lifespan_context.odoo
-    user_tz = get_user_timezone(odoo)
+    odoo = _get_odoo_async(ctx)
+    try:
+        uid = await odoo.authenticate()
+        user = await odoo.execute_method("res.users", "read", [uid], ["tz"])
+    except Exception as e:
+        user = e
+    user_tz = _user_timezone(user)
     return datetime.now(tz=user_tz).strftime("%Y-%m-%d %H:%M:%S")
 
-def get_user_timezone(odoo_client: OdooClient) -> ZoneInfo:
+
+def _user_timezone(user) -> ZoneInfo:
     """
-    获取当前用户在 Odoo 中设置的时区，如果未设置则使用 UTC
-    
-    Parameters:
-        odoo_client: Odoo 客户端实例
-        
-    Returns:
-        ZoneInfo: 用户时区对象
+    从 res.users 的 read 结果中取出时区，未设置或读取失败（异常）时使用 UTC
     """
     try:
-        user = odoo_client.execute_method("res.users", "read", [odoo_client.uid], ["tz"])
+        if isinstance(user, Exception):
+            raise user
         user_tz = user[0].get("tz") if user else None
         
         if user_tz:
@@ -1251,3 +1660,79 @@ def get_user_timezone(odoo_client: OdooClient) -> ZoneInfo:
         # 如果获取失败，返回 UTC 作为安全默认值
         return ZoneInfo("UTC")
 
+
+class ToolCall(BaseModel):
+    """A single tool invocation inside batch_execute."""
+
+    tool: str = Field(description="Name of the tool to call")
+    args: Dict[str, Any] = Field(
+        default_factory=dict, description="Arguments for the tool"
+    )
+
+
+def _is_read_only(call: ToolCall, tools: dict) -> bool:
+    """Whether a batched call only reads, so it may run alongside others"""
+    if call.tool == "execute_method":
+        return call.args.get("method") in _READ_METHODS
+    tool = tools.get(call.tool)
+    return bool(tool and tool.annotations and tool.annotations.readOnlyHint)
+
+
+@mcp.tool(
+    description="Call several tools in one request; read-only calls run concurrently, other calls one at a time in the given order"
+)
+async def batch_execute(
+    calls: List[ToolCall],
+) -> Dict[str, Any]:
+    """
+    Run several tool calls and return their results in order.
+
+    Consecutive read-only calls run concurrently. Any other call (e.g. one
+    that creates records) waits for the calls before it and finishes before
+    the calls after it start, so dependent writes keep their order.
+
+    Parameters:
+        calls: The tools to call, each with its name and arguments
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating success
+        - results: One entry per call, either the tool's structured result
+          (what MCP returns as structuredContent; plain values and dicts are
+          wrapped as {"result": ...}) or {"success": False, "error": ...} if
+          the call failed
+    """
+
+    async def run(call: ToolCall):
+        if call.tool == "batch_execute":
+            raise ValueError("batch_execute cannot be nested")
+        # Same argument validation and Context injection as a direct call
+        result = await mcp.call_tool(call.tool, call.args)
+        # Tools with an output schema return (content, structured content)
+        if isinstance(result, tuple):
+            return result[1]
+        return [block.model_dump(mode="json") for block in result]
+
+    tools = {tool.name: tool for tool in await mcp.list_tools()}
+    results = []
+    reads = []
+    for call in calls:
+        if _is_read_only(call, tools):
+            reads.append(run(call))
+            continue
+        results += await asyncio.gather(*reads, return_exceptions=True)
+        reads = []
+        results += await asyncio.gather(run(call), return_exceptions=True)
+    results += await asyncio.gather(*reads, return_exceptions=True)
+
+    return {
+        "success": True,
+        "results": [
+            (
+                {"success": False, "error": str(result)}
+                if isinstance(result, Exception)
+                else result
+            )
+            for result in results
+        ],
+    }
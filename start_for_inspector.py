@@ -9,6 +9,7 @@ import asyncio
 # 确保可以导入我们的模块
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from odoo_mcp.odoo_client import LOGGED_ENV_VARS, configure_logging
 from odoo_mcp.server import mcp
 
 def main():
@@ -16,16 +17,14 @@ def main():
     try:
         print("Starting Odoo MCP Server for Inspector...", file=sys.stderr)
         print(f"Python version: {sys.version}", file=sys.stderr)
+        configure_logging()
         
         # 检查环境变量
-        odoo_vars = {k: v for k, v in os.environ.items() if k.startswith('ODOO_')}
+        odoo_vars = {k: os.environ[k] for k in LOGGED_ENV_VARS if os.environ.get(k)}
         if odoo_vars:
             print("Environment variables:", file=sys.stderr)
             for k, v in odoo_vars.items():
-                if k == 'ODOO_PASSWORD':
-                    print(f"  {k}: ***hidden***", file=sys.stderr)
-                else:
-                    print(f"  {k}: {v}", file=sys.stderr)
+                print(f"  {k}: {v}", file=sys.stderr)
         
         # 使用 run() 方法启动服务器
         mcp.run()
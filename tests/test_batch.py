@@ -0,0 +1,74 @@
+"""
+Tests for the ordering guarantees of the batch_execute tool
+"""
+
+import asyncio
+
+import pytest
+
+from odoo_mcp import server
+from odoo_mcp.server import ToolCall, batch_execute
+
+
+@pytest.fixture
+def events(monkeypatch):
+    """Record when each dispatched tool call starts and ends"""
+    log = []
+
+    async def call_tool(name, arguments):
+        label = arguments.get("label", name)
+        log.append(("start", label))
+        await asyncio.sleep(0.01)
+        log.append(("end", label))
+        return [], {"result": label}
+
+    monkeypatch.setattr(server.mcp, "call_tool", call_tool)
+    return log
+
+
+def read(label):
+    return ToolCall(
+        tool="execute_method",
+        args={"model": "res.partner", "method": "search_read", "label": label},
+    )
+
+
+def write(label):
+    return ToolCall(
+        tool="execute_method",
+        args={"model": "res.partner", "method": "write", "label": label},
+    )
+
+
+def test_results_keep_the_order_of_the_calls(events):
+    calls = [read("r1"), write("w1"), read("r2"), ToolCall(tool="get-current-date")]
+    result = asyncio.run(batch_execute(calls))
+    assert result["results"] == [
+        {"result": "r1"},
+        {"result": "w1"},
+        {"result": "r2"},
+        {"result": "get-current-date"},
+    ]
+
+
+def test_consecutive_reads_run_concurrently(events):
+    asyncio.run(batch_execute([read("r1"), read("r2")]))
+    assert events[:2] == [("start", "r1"), ("start", "r2")]
+
+
+def test_writes_run_alone_and_in_order(events):
+    calls = [read("r1"), read("r2"), write("w1"), write("w2"), read("r3")]
+    asyncio.run(batch_execute(calls))
+    position = {event: i for i, event in enumerate(events)}
+    assert position[("end", "r1")] < position[("start", "w1")]
+    assert position[("end", "r2")] < position[("start", "w1")]
+    assert position[("end", "w1")] < position[("start", "w2")]
+    assert position[("end", "w2")] < position[("start", "r3")]
+
+
+def test_failed_calls_are_reported_in_place(events):
+    calls = [read("r1"), ToolCall(tool="batch_execute"), read("r2")]
+    result = asyncio.run(batch_execute(calls))
+    assert result["results"][0] == {"result": "r1"}
+    assert result["results"][1]["success"] is False
+    assert result["results"][2] == {"result": "r2"}
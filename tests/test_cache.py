@@ -0,0 +1,168 @@
+"""
+Tests for ModelMetadataCache and OdooClient's read cache
+"""
+
+import pytest
+
+from odoo_mcp import cache as cache_module
+from odoo_mcp.cache import ModelMetadataCache
+from odoo_mcp.odoo_client import OdooClient, _ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time.monotonic() in the cache module with a settable clock"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_metadata_cache_hit_and_miss():
+    cache = ModelMetadataCache()
+    assert cache.get("key", "default") == "default"
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_metadata_cache_entries_expire(clock):
+    cache = ModelMetadataCache(ttl=10)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=1)
+    cache.set("forever", 3, ttl=float("inf"))
+
+    clock[0] += 5
+    assert cache.get("default") == 1
+    assert cache.get("short") is None
+
+    clock[0] += 10
+    assert cache.get("default") is None
+    assert cache.get("forever") == 3
+
+
+def test_metadata_cache_evicts_least_recently_used():
+    cache = ModelMetadataCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_get_or_fetch_fetches_once():
+    cache = ModelMetadataCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"name": {"type": "char"}}
+
+    assert cache.get_or_fetch("fields", fetch) == {"name": {"type": "char"}}
+    assert cache.get_or_fetch("fields", fetch) == {"name": {"type": "char"}}
+    assert len(calls) == 1
+
+
+def test_get_or_fetch_does_not_cache_errors():
+    cache = ModelMetadataCache()
+
+    def fail():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        cache.get_or_fetch("fields", fail)
+    assert cache.get_or_fetch("fields", lambda: "ok") == "ok"
+
+
+def test_response_cache_skips_results_read_before_a_clear():
+    cache = _ResponseCache()
+    generation = cache.generation
+    cache.clear()
+    cache.set("key", "stale", generation)
+    assert cache.get("key") is None
+
+    cache.set("key", "fresh", cache.generation)
+    assert cache.get("key") == "fresh"
+
+
+def make_client(exec_kw, **kwargs):
+    """An OdooClient that is logged in and sends calls to ``exec_kw``"""
+    client = OdooClient("http://odoo.test", "db", "admin", "admin", **kwargs)
+    client._uid = 2
+    client._exec_kw = exec_kw
+    return client
+
+
+def test_read_cache_is_disabled_by_default():
+    calls = []
+    client = make_client(lambda *args: calls.append(args) or [])
+    client.execute_method("res.partner", "search_read", [])
+    client.execute_method("res.partner", "search_read", [])
+    assert len(calls) == 2
+
+
+def test_read_cache_hit_returns_a_copy():
+    calls = []
+
+    def exec_kw(db, uid, password, model, method, args, kwargs):
+        calls.append(method)
+        return [{"id": 1, "name": "A"}]
+
+    client = make_client(exec_kw, cache_ttl=30)
+    client.execute_method("res.partner", "search_read", [])
+    hit = client.execute_method("res.partner", "search_read", [])
+    hit[0]["name"] = "changed"
+    assert client.execute_method("res.partner", "search_read", []) == [
+        {"id": 1, "name": "A"}
+    ]
+    assert calls == ["search_read"]
+
+
+def test_write_clears_the_read_cache_after_it_is_sent():
+    state = {"name": "A"}
+    calls = []
+
+    def exec_kw(db, uid, password, model, method, args, kwargs):
+        calls.append(method)
+        if method == "write":
+            state["name"] = "B"
+            return True
+        return [{"id": 1, "name": state["name"]}]
+
+    client = make_client(exec_kw, cache_ttl=30)
+    client.execute_method("res.partner", "search_read", [])
+    client.execute_method("res.partner", "write", [1], {"name": "B"})
+    assert client.execute_method("res.partner", "search_read", []) == [
+        {"id": 1, "name": "B"}
+    ]
+    assert calls == ["search_read", "write", "search_read"]
+
+
+def test_read_racing_a_write_is_not_cached():
+    calls = []
+
+    def exec_kw(db, uid, password, model, method, args, kwargs):
+        calls.append(method)
+        if len(calls) == 1:
+            # A write sent from another thread finishes while this read is
+            # in flight
+            client.invalidate_for_write("res.partner")
+            return [{"id": 1, "name": "before"}]
+        return [{"id": 1, "name": "after"}]
+
+    client = make_client(exec_kw, cache_ttl=30)
+    client.execute_method("res.partner", "search_read", [])
+    assert client.execute_method("res.partner", "search_read", []) == [
+        {"id": 1, "name": "after"}
+    ]
+    assert len(calls) == 2
+
+
+def test_writes_to_ir_model_clear_the_metadata_cache():
+    client = make_client(lambda *args: True)
+    client.metadata_cache.set("ir.model", ["res.partner"])
+    client.execute_method("res.partner", "write", [1], {})
+    assert client.metadata_cache.get("ir.model") == ["res.partner"]
+    client.execute_method("ir.model.fields", "create", [{}])
+    assert client.metadata_cache.get("ir.model") is None
@@ -0,0 +1,64 @@
+"""
+Tests for the domain normalization of the execute_method tool
+"""
+
+import pytest
+
+from odoo_mcp.server import _normalize_domain
+
+
+def test_well_formed_domain_is_returned_unchanged():
+    domain = [["name", "ilike", "test"], ["is_company", "=", True]]
+    assert _normalize_domain(domain) is domain
+
+
+def test_single_condition_is_wrapped():
+    assert _normalize_domain(["name", "=", "x"]) == [["name", "=", "x"]]
+
+
+def test_extra_wrapping_is_removed():
+    assert _normalize_domain([[["name", "=", "x"], ["id", ">", 1]]]) == [
+        ["name", "=", "x"],
+        ["id", ">", 1],
+    ]
+
+
+def test_logical_operators_are_kept():
+    domain = ["|", ["name", "=", "a"], ["name", "=", "b"]]
+    assert _normalize_domain(domain) == domain
+
+
+def test_invalid_conditions_are_dropped():
+    domain = [["name", "=", "a"], ["too", "short"], [1, "=", 2]]
+    assert _normalize_domain(domain) == [["name", "=", "a"]]
+
+
+def test_conditions_object():
+    domain = {
+        "conditions": [
+            {"field": "name", "operator": "ilike", "value": "x"},
+            {"field": "incomplete"},
+        ]
+    }
+    assert _normalize_domain(domain) == [["name", "ilike", "x"]]
+
+
+@pytest.mark.parametrize(
+    "domain",
+    [
+        '[["name", "ilike", "x"], ["active", "=", true]]',
+        "[('name', 'ilike', 'x'), ('active', '=', True)]",
+        '{"conditions": [{"field": "name", "operator": "ilike", "value": "x"},'
+        ' {"field": "active", "operator": "=", "value": true}]}',
+    ],
+)
+def test_domain_strings(domain):
+    assert _normalize_domain(domain) == [
+        ["name", "ilike", "x"],
+        ["active", "=", True],
+    ]
+
+
+@pytest.mark.parametrize("domain", [None, "", "not a domain", 42, []])
+def test_unusable_domains_become_empty(domain):
+    assert _normalize_domain(domain) == []
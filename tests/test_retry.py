@@ -0,0 +1,143 @@
+"""
+Tests for the retry policy: reads are retried, writes are sent only once
+"""
+
+import asyncio
+import socket
+import xmlrpc.client
+
+import httpx
+import pytest
+
+from odoo_mcp import async_client, odoo_client
+from odoo_mcp.async_client import AsyncOdooClient
+from odoo_mcp.odoo_client import (
+    OdooClient,
+    SessionTransport,
+    _follow_redirects,
+    _with_retry,
+)
+
+# Network errors after which a request may or may not have reached Odoo
+NETWORK_ERRORS = [
+    ConnectionResetError("reset"),
+    socket.timeout("timed out"),
+    xmlrpc.client.ProtocolError("odoo.test/xmlrpc/2/object", 502, "Bad Gateway", {}),
+]
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    """Retry without waiting"""
+    monkeypatch.setattr(odoo_client, "_backoff_delay", lambda *args: 0)
+    monkeypatch.setattr(async_client, "_backoff_delay", lambda *args: 0)
+
+
+def failing_client(error):
+    """An OdooClient whose every call fails with ``error``; returns (client, calls)"""
+    calls = []
+
+    def exec_kw(db, uid, password, model, method, args, kwargs):
+        calls.append(method)
+        raise error
+
+    client = OdooClient("http://odoo.test", "db", "admin", "admin")
+    client._uid = 2
+    client._exec_kw = exec_kw
+    return client, calls
+
+
+@pytest.mark.parametrize("error", NETWORK_ERRORS)
+@pytest.mark.parametrize("method", ["create", "write", "unlink", "action_confirm"])
+def test_sync_writes_are_sent_once(error, method):
+    client, calls = failing_client(error)
+    with pytest.raises(type(error)):
+        client.execute_method("res.partner", method, [1])
+    assert calls == [method]
+
+
+@pytest.mark.parametrize("error", NETWORK_ERRORS)
+def test_sync_reads_are_retried(error):
+    client, calls = failing_client(error)
+    with pytest.raises(type(error)):
+        client.execute_method("res.partner", "search_read", [])
+    assert calls == ["search_read"] * 3
+
+
+def test_faults_are_not_retried():
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise xmlrpc.client.Fault(1, "ValidationError")
+
+    with pytest.raises(xmlrpc.client.Fault):
+        _with_retry(fail)
+    assert len(calls) == 1
+
+
+def test_session_transport_only_retries_connection_attempts():
+    transport = SessionTransport(use_https=False)
+    retry = transport.session.get_adapter("http://odoo.test").max_retries
+    assert retry.read == 0
+    assert retry.status == 0
+    assert not retry.status_forcelist
+
+
+def test_redirects_are_followed_with_the_same_request():
+    sent = []
+
+    def send(host, handler):
+        sent.append((host, handler))
+        if len(sent) == 1:
+            # xmlrpc.client passes headers as a plain, case-sensitive dict
+            raise xmlrpc.client.ProtocolError(
+                host + handler, 301, "Moved", {"Location": "https://new.test/x"}
+            )
+        return "ok"
+
+    assert _follow_redirects(send, "odoo.test", "/xmlrpc/2/object", 5) == "ok"
+    assert sent == [("odoo.test", "/xmlrpc/2/object"), ("new.test", "/x")]
+
+
+def async_client_with(handler):
+    """An AsyncOdooClient that is logged in and answers with ``handler``"""
+    client = AsyncOdooClient("http://odoo.test", "db", "admin", "admin", uid=2)
+    client._http = httpx.AsyncClient(
+        base_url="http://odoo.test", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.parametrize(
+    "method, attempts", [("write", 1), ("create", 1), ("search_read", 3)]
+)
+def test_async_retry_policy(method, attempts):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        raise httpx.ConnectError("refused", request=request)
+
+    client = async_client_with(handler)
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(client.execute_method("res.partner", method, [1]))
+    assert len(requests) == attempts
+
+
+def test_async_redirects_keep_the_post():
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.url.path == "/xmlrpc/2/object":
+            return httpx.Response(301, headers={"Location": "/odoo/xmlrpc/2/object"})
+        body = xmlrpc.client.dumps((42,), methodresponse=True)
+        return httpx.Response(200, content=body.encode())
+
+    client = async_client_with(handler)
+    assert asyncio.run(client.execute_method("res.partner", "write", [1])) == 42
+    assert requests == [
+        ("POST", "/xmlrpc/2/object"),
+        ("POST", "/odoo/xmlrpc/2/object"),
+    ]